@@ -0,0 +1,5 @@
+"""Configuration package for ViraLearn ContentBot."""
+
+from config.settings import AppSettings, get_settings, reload_settings
+
+__all__ = ["AppSettings", "get_settings", "reload_settings"]
@@ -0,0 +1,244 @@
+"""Database connection setup for ViraLearn ContentBot.
+
+Provides the async SQLAlchemy engine, session factory and FastAPI session
+dependency. Falls back to a local SQLite database when PostgreSQL is not
+reachable (dev/test environments).
+"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import StaticPool
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+Base = declarative_base()
+
+# Built once: text() parses the SQL into a TextClause, which is not free on
+# a per-health-check basis.
+_PING_SQL = text("SELECT 1")
+
+# PRAGMAs applied to every new SQLite connection.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=10000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+# asyncpg connect arguments, built once. "jit": "off" avoids PostgreSQL's
+# query JIT warm-up cost (20-100ms on first execution, rarely a win for
+# OLTP); the statement cache sizes keep prepared statements hot across the
+# pool for repeated ORM query shapes.
+_PG_CONNECT_ARGS = {
+    "server_settings": {
+        "application_name": "viralearn_contentbot",
+        "jit": "off",
+    },
+    "statement_cache_size": 512,
+    "prepared_statement_cache_size": 512,
+}
+
+
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    """Apply performance PRAGMAs to new SQLite connections.
+
+    Registered per-engine against SQLite engines only, so PostgreSQL
+    connections never pay for the callback.
+    """
+    # One cursor, one execute per PRAGMA: the aiosqlite adapter exposes
+    # the DBAPI cursor interface but not executescript.
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+class DatabaseManager:
+    """Manages the async engine with a SQLite fallback for local use."""
+
+    def __init__(self):
+        self.engine: Optional[AsyncEngine] = None
+        self.session_factory = None
+        self.scoped = None
+        self._initialized = False
+        # Created lazily in initialize(); no event loop exists at import time.
+        self._init_lock: Optional[asyncio.Lock] = None
+
+    async def initialize(self):
+        """Create the async engine, falling back to SQLite on failure."""
+        if self._initialized:
+            return
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if self._initialized:
+                return
+            await self._do_initialize()
+
+    async def _do_initialize(self):
+        settings = get_settings()
+        try:
+            self.engine = create_async_engine(
+                settings.database.url,
+                pool_size=settings.database.pool_size,
+                max_overflow=settings.database.max_overflow,
+                pool_pre_ping=settings.database.pool_pre_ping,
+                pool_recycle=3600,
+                echo=settings.database.echo,
+                connect_args=_PG_CONNECT_ARGS,
+            )
+            await self.test_connection()
+        except Exception:
+            logger.exception("Database initialization failed")
+            db_path = Path("contentbot_fallback.db")
+            logger.info("Falling back to SQLite at %s", db_path)
+            # Shared-cache URI: all aiosqlite connections share one page
+            # cache, so WAL writers stop serializing against each other.
+            sqlite_url = f"sqlite+aiosqlite:///file:{db_path}?cache=shared&uri=true"
+            # StaticPool keeps one connection alive for the whole process:
+            # no reconnect cost, no PRAGMA re-execution, no WAL contention.
+            self.engine = create_async_engine(
+                sqlite_url,
+                echo=settings.database.echo,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False, "uri": True},
+            )
+        if self.engine.url.get_backend_name() == "sqlite" and not event.contains(
+            self.engine.sync_engine, "connect", set_sqlite_pragma
+        ):
+            event.listens_for(self.engine.sync_engine, "connect")(
+                set_sqlite_pragma
+            )
+        self.session_factory = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+        # Task-scoped session registry: reuses one AsyncSession per asyncio
+        # task instead of building a fresh session object graph per request.
+        self.scoped = async_scoped_session(
+            self.session_factory, scopefunc=asyncio.current_task
+        )
+        self._initialized = True
+
+    async def test_connection(self):
+        """Run a trivial query to verify the engine can reach the database."""
+        try:
+            # connect() skips the BEGIN/COMMIT pair that engine.begin() adds
+            # around a query that needs no transaction.
+            async with self.engine.connect() as conn:
+                await conn.execute(_PING_SQL)
+            logger.debug("Database connection test successful")
+        except Exception:
+            logger.exception("Database connection test failed")
+            raise
+
+    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Yield a session that commits on success and rolls back on error."""
+        if not self._initialized:
+            await self.initialize()
+        session = self.scoped()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await self.scoped.remove()
+
+    async def close(self):
+        """Dispose of the engine and its connection pool."""
+        if self.engine:
+            await self.engine.dispose()
+            self._initialized = False
+
+
+db_manager = DatabaseManager()
+
+
+async def init_database():
+    """Initialize the global database manager."""
+    await db_manager.initialize()
+
+
+def get_db_manager() -> DatabaseManager:
+    """Return the global database manager."""
+    return db_manager
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency yielding a database session.
+
+    Deliberately flat: wrapping DatabaseManager.get_session in an
+    ``async for`` here would drive two generator state machines per
+    request instead of one.
+    """
+    manager = get_db_manager()
+    if not manager._initialized:
+        await manager.initialize()
+    session = manager.scoped()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await manager.scoped.remove()
+
+
+_HEALTH_TTL_SECONDS = 10.0
+_last_ok_ts = 0.0
+
+
+async def check_database_health() -> dict:
+    """Return a health-check payload for the database connection.
+
+    A recent successful probe is cached for a few seconds so that
+    aggressive liveness probes do not round-trip to the database on
+    every hit. Only successes are cached, so a cached "healthy" can lag
+    an outage by up to the TTL — bounded staleness that liveness probes
+    tolerate; failures always re-probe.
+    """
+    global _last_ok_ts
+    settings = get_settings()
+    now = time.monotonic()
+    if now - _last_ok_ts < _HEALTH_TTL_SECONDS:
+        return {
+            "status": "healthy",
+            "pool_size": settings.database.pool_size,
+            "cached": True,
+        }
+    try:
+        # The probe may run before anything else touched the database
+        # (health CLI, fresh API process); bring the engine up first like
+        # get_session does.
+        if not db_manager._initialized:
+            await db_manager.initialize()
+        await db_manager.test_connection()
+        _last_ok_ts = time.monotonic()
+        return {
+            "status": "healthy",
+            "pool_size": settings.database.pool_size,
+        }
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e)}
@@ -0,0 +1,198 @@
+"""Configuration management for ViraLearn ContentBot.
+
+All settings are loaded from environment variables (optionally via a `.env`
+file) using pydantic-settings. Each subsystem gets its own settings model,
+aggregated under :class:`AppSettings`.
+"""
+
+import functools
+from typing import List, Optional
+from urllib.parse import quote_plus
+
+from dotenv import load_dotenv
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Parse .env exactly once at import time. Each BaseSettings subclass used to
+# re-read the file from disk via env_file=".env" — seven parses per startup.
+load_dotenv()
+
+_VALID_PLATFORMS = frozenset(
+    {"twitter", "linkedin", "instagram", "facebook", "youtube", "tiktok"}
+)
+_VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+# Probe for asyncpg once at import; DatabaseSettings.url used to run the
+# try/except import on every access.
+try:
+    import asyncpg  # noqa: F401
+
+    _HAS_ASYNCPG = True
+except ImportError:
+    _HAS_ASYNCPG = False
+
+
+class DatabaseSettings(BaseSettings):
+    """PostgreSQL connection settings with SQLite fallback support."""
+
+    model_config = SettingsConfigDict(env_prefix="DB_", extra="ignore", frozen=True, validate_assignment=False)
+
+    host: str = Field(default="localhost")
+    port: int = Field(default=5432)
+    user: str = Field(default="contentbot")
+    password: str = Field(default="contentbot")
+    name: str = Field(default="contentbot")
+    pool_size: int = Field(
+        default=20,
+        description=(
+            "Connections kept open in the pool. pool_size + max_overflow must "
+            "cover the maximum number of concurrent requests or checkouts "
+            "queue up behind QueuePool."
+        ),
+    )
+    max_overflow: int = Field(
+        default=-1,
+        description=(
+            "Extra connections allowed beyond pool_size; -1 means unlimited "
+            "overflow so bursts never hit 'QueuePool limit ... timed out'."
+        ),
+    )
+    pool_pre_ping: bool = Field(
+        default=False,
+        description=(
+            "Issue a liveness probe on every connection checkout. Disabled by "
+            "default because the probe adds a round-trip per checkout; "
+            "pool_recycle already handles stale connections for the common "
+            "case. Enable only when the database drops idle connections "
+            "unpredictably (equivalent of SQLALCHEMY_ENGINE_OPTION_PRE_PING)."
+        ),
+    )
+    echo: bool = Field(default=False)
+
+    @functools.cached_property
+    def url(self) -> str:
+        """Build the SQLAlchemy connection URL for the configured database.
+
+        Cached on first access so the password quoting and string build
+        happen once per settings instance.
+        """
+        driver = "postgresql+asyncpg" if _HAS_ASYNCPG else "postgresql"
+        return (
+            f"{driver}://{self.user}:{quote_plus(self.password)}"
+            f"@{self.host}:{self.port}/{self.name}"
+        )
+
+
+class GeminiSettings(BaseSettings):
+    """Google Gemini API settings."""
+
+    model_config = SettingsConfigDict(env_prefix="GEMINI_", extra="ignore", frozen=True, validate_assignment=False)
+
+    api_key: str = Field(default="")
+    model: str = Field(default="gemini-2.0-flash")
+    temperature: float = Field(default=0.7)
+    max_output_tokens: int = Field(default=8192)
+
+
+class RedisSettings(BaseSettings):
+    """Redis cache settings."""
+
+    model_config = SettingsConfigDict(env_prefix="REDIS_", extra="ignore", frozen=True, validate_assignment=False)
+
+    host: str = Field(default="localhost")
+    port: int = Field(default=6379)
+    db: int = Field(default=0)
+    password: Optional[str] = Field(default=None)
+
+
+class APISettings(BaseSettings):
+    """FastAPI server settings."""
+
+    model_config = SettingsConfigDict(env_prefix="API_", extra="ignore", frozen=True, validate_assignment=False)
+
+    host: str = Field(default="0.0.0.0")
+    port: int = Field(default=8000)
+    workers: int = Field(default=1)
+    cors_origins: List[str] = Field(default_factory=lambda: ["*"])
+
+
+class SecuritySettings(BaseSettings):
+    """Authentication and token settings."""
+
+    model_config = SettingsConfigDict(env_prefix="SECURITY_", extra="ignore", frozen=True, validate_assignment=False)
+
+    secret_key: str = Field(default="change-me-in-production")
+    algorithm: str = Field(default="HS256")
+    access_token_expire_minutes: int = Field(default=30)
+
+
+class ContentSettings(BaseSettings):
+    """Content generation settings."""
+
+    model_config = SettingsConfigDict(env_prefix="CONTENT_", extra="ignore", frozen=True, validate_assignment=False)
+
+    supported_platforms: List[str] = Field(
+        default_factory=lambda: ["twitter", "linkedin", "instagram"]
+    )
+    max_content_length: int = Field(default=10000)
+    default_tone: str = Field(default="professional")
+
+    @field_validator("supported_platforms", mode="after")
+    @classmethod
+    def validate_platforms(cls, v):
+        for platform in v:
+            if platform not in _VALID_PLATFORMS:
+                raise ValueError(f"Unsupported platform: {platform}")
+        return v
+
+
+class MonitoringSettings(BaseSettings):
+    """Logging and metrics settings."""
+
+    model_config = SettingsConfigDict(env_prefix="MONITORING_", extra="ignore", frozen=True, validate_assignment=False)
+
+    log_level: str = Field(default="INFO")
+    metrics_enabled: bool = Field(default=True)
+
+    @field_validator("log_level", mode="after")
+    @classmethod
+    def validate_log_level(cls, v):
+        upper = v.upper()
+        if upper not in _VALID_LEVELS:
+            raise ValueError(f"Invalid log level: {v}")
+        return upper
+
+
+class AppSettings(BaseSettings):
+    """Aggregated application settings."""
+
+    model_config = SettingsConfigDict(extra="ignore", frozen=True, validate_assignment=False)
+
+    app_name: str = Field(default="ViraLearn ContentBot")
+    environment: str = Field(default="development")
+    debug: bool = Field(default=False)
+
+    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
+    gemini: GeminiSettings = Field(default_factory=GeminiSettings)
+    redis: RedisSettings = Field(default_factory=RedisSettings)
+    api: APISettings = Field(default_factory=APISettings)
+    security: SecuritySettings = Field(default_factory=SecuritySettings)
+    content: ContentSettings = Field(default_factory=ContentSettings)
+    monitoring: MonitoringSettings = Field(default_factory=MonitoringSettings)
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """Return the cached application settings, creating them on first use."""
+    return AppSettings()
+
+
+def reload_settings() -> AppSettings:
+    """Force settings to be re-read from the environment.
+
+    Settings models are frozen, so this is the only supported way to pick
+    up changed configuration: it discards the cached singleton and builds
+    a fresh one.
+    """
+    get_settings.cache_clear()
+    return get_settings()
@@ -0,0 +1,19 @@
+"""Manual debug harness for the Gemini SDK import.
+
+Run directly (``python debug_import.py``); importing google.generativeai
+costs ~200ms of SDK initialization, so it is deferred into main() and
+never triggered by tooling that merely imports this file.
+"""
+
+
+def main():
+    try:
+        import google.generativeai as genai  # noqa: PLC0415
+
+        print(f"google.generativeai imported OK: {genai.__version__}")
+    except ImportError as e:
+        print(f"google.generativeai import failed: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Manual debug harness for the LLM service.
+
+Run directly (``python debug_llm.py``); the heavyweight service imports
+stay inside the function so pytest collection, linters and IDE indexers
+never pay the Gemini SDK load cost.
+"""
+
+import asyncio
+
+
+async def debug_llm():
+    from src.services.llm_service import (  # noqa: PLC0415
+        GOOGLE_AI_AVAILABLE,
+        GenerationRequest,
+        LLMService,
+    )
+
+    print(f"google-generativeai available: {GOOGLE_AI_AVAILABLE}")
+    service = LLMService()
+    request = GenerationRequest(prompt="Say hello in one short sentence.")
+    response = await service.generate(request)
+    print(f"Response: {response}")
+
+
+if __name__ == "__main__":
+    asyncio.run(debug_llm())
@@ -0,0 +1,199 @@
+"""End-to-end demo of the content generation building blocks.
+
+Run directly: ``python demo_content_generation.py``.
+"""
+
+import asyncio
+import sys
+
+# Agent and model imports live inside the demo stages: each stage pays only
+# for what it exercises, and the script starts printing immediately.
+
+# The four demo stages are independent; cap their concurrency anyway so a
+# larger future demo set cannot stampede agent initialization.
+_DEMO_SEMAPHORE = asyncio.Semaphore(4)
+
+
+
+# Index with a bool: False -> 0, True -> 1. Two interned strings instead of
+# four f-string ternaries per summary.
+MARK = ("❌ FAIL", "✅ PASS")
+
+
+def _flush(lines):
+    """Emit a section's output in one buffered write instead of many prints."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+SAMPLE_TEXT = (
+    "Artificial intelligence is transforming content creation. "
+    "Modern language models can draft blog posts, social media updates and "
+    "marketing copy in seconds, while human editors focus on strategy and "
+    "brand voice. The result is faster, more consistent content pipelines."
+)
+
+# Static demo payloads built once at import instead of on every run.
+# Tuples, so repeated runs cannot accidentally mutate the shared fixtures.
+_BLOG_SECTIONS = (
+    {"heading": "Introduction", "content": "AI is everywhere."},
+    {"heading": "The Pipeline", "content": "From prompt to post."},
+    {"heading": "Conclusion", "content": "Humans still steer."},
+)
+_BLOG_KEYWORDS = (
+    "artificial intelligence",
+    "content creation",
+    "automation",
+    "marketing",
+)
+
+
+async def demo_agent_initialization():
+    """Instantiate each core agent and report success."""
+    from src.agents import get_analyzer, get_planner, get_qa
+
+    out = ["=== Agent Initialization ==="]
+    try:
+        async with _DEMO_SEMAPHORE:
+            analyzer, planner, qa = await asyncio.gather(
+                asyncio.to_thread(get_analyzer),
+                asyncio.to_thread(get_planner),
+                asyncio.to_thread(get_qa),
+            )
+        out.append(f"InputAnalyzer ready: {analyzer.name}")
+        out.append(f"ContentPlanner ready: {planner.name}")
+        out.append(f"QualityAssurance ready: {qa.name}")
+        return True
+    except Exception as e:
+        out.append(f"Agent initialization failed: {e}")
+        return False
+    finally:
+        _flush(out)
+
+
+async def demo_state_management():
+    """Create a workflow state and walk it through a simulated step."""
+    from src.models.state_models import ContentState, WorkflowStatus
+
+    out = ["=== State Management ==="]
+    try:
+        state = ContentState(
+            workflow_id="demo-workflow-001",
+            user_id="demo-user",
+            original_input={"text": SAMPLE_TEXT, "content_type": "blog"},
+        )
+        out.append(f"Created state: {state.workflow_id} status={state.status}")
+
+        # Trusted internal mutation: one bulk write, no per-field dispatch.
+        state.update_trusted(
+            step_count=state.step_count + 1,
+            current_agent="InputAnalyzer",
+            status=WorkflowStatus.IN_PROGRESS,
+        )
+        state.update_trusted(
+            quality_scores={"main_content": 8.7},
+            text_content={"main_content": SAMPLE_TEXT},
+        )
+        out.append(f"Advanced state: step={state.step_count} agent={state.current_agent}")
+        return True, state
+    except Exception as e:
+        out.append(f"State management failed: {e}")
+        return False, None
+    finally:
+        _flush(out)
+
+
+async def demo_content_models():
+    """Build the content model payloads used by the generators."""
+    from src.models.content_models import BlogPost, SocialPost
+
+    out = ["=== Content Models ==="]
+    try:
+        blog_post = BlogPost(
+            title="How AI Is Changing Content Creation",
+            summary="A look at AI-assisted content pipelines.",
+            sections=list(_BLOG_SECTIONS),
+            keywords=list(_BLOG_KEYWORDS),
+            word_count=850,
+        )
+        social_post = SocialPost(
+            platform="twitter",
+            content="AI-assisted content pipelines are here. 🚀",
+            hashtags=["AI", "ContentCreation"],
+            character_count=44,
+        )
+        out.append(f"BlogPost: {blog_post.title} ({blog_post.word_count} words)")
+        out.append(f"SocialPost: {social_post.platform} ({social_post.character_count} chars)")
+        return True, blog_post, social_post
+    except Exception as e:
+        out.append(f"Content models failed: {e}")
+        return False, None, None
+    finally:
+        _flush(out)
+
+
+async def demo_agent_methods():
+    """Exercise the public methods of the input analyzer."""
+    from src.agents import get_analyzer
+
+    out = ["=== Agent Methods ==="]
+    try:
+        async with _DEMO_SEMAPHORE:
+            analyzer = await asyncio.to_thread(get_analyzer)
+        # One pass over the MRO's class __dict__s: no per-name getattr
+        # descriptor resolution and no double sort like dir() + sorted()
+        # would cost, while still listing inherited methods (run, arun).
+        members = {
+            name: val
+            for klass in reversed(type(analyzer).__mro__)
+            for name, val in vars(klass).items()
+        }
+        methods = sorted(
+            name
+            for name, val in members.items()
+            if not name.startswith("_") and callable(val)
+        )
+        out.append(f"Public methods: {methods}")
+
+        keywords = analyzer.extract_keywords(SAMPLE_TEXT)
+        out.append(f"Keywords: {keywords}")
+        sentiment = analyzer.analyze_sentiment(SAMPLE_TEXT)
+        out.append(f"Sentiment: {sentiment}")
+        return True
+    except Exception as e:
+        out.append(f"Agent methods failed: {e}")
+        return False
+    finally:
+        _flush(out)
+
+
+async def main():
+    print("ViraLearn ContentBot — content generation demo")
+    print("=" * 50)
+
+    # The stages are independent: run them concurrently so wall-clock is
+    # max(stage) instead of sum(stages).
+    (
+        agents_ok,
+        (state_ok, state),
+        (models_ok, blog_post, social_post),
+        methods_ok,
+    ) = await asyncio.gather(
+        demo_agent_initialization(),
+        demo_state_management(),
+        demo_content_models(),
+        demo_agent_methods(),
+    )
+
+    _flush([
+        "=" * 50,
+        "Summary:",
+        f"  Agents:  {MARK[agents_ok]}",
+        f"  State:   {MARK[state_ok]}",
+        f"  Models:  {MARK[models_ok]}",
+        f"  Methods: {MARK[methods_ok]}",
+    ])
+    return all([agents_ok, state_ok, models_ok, methods_ok])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+"""Smoke test for a locally running ContentBot deployment.
+
+Checks the core Python components plus the HTTP API of a server expected at
+``http://localhost:8000``. Run directly: ``python final_system_test.py``.
+"""
+
+import asyncio
+import sys
+
+import httpx
+import orjson
+
+from src.models.content_models import BlogPost, SocialPost
+from src.models.state_models import ContentState
+
+BASE_URL = "http://localhost:8000"
+
+# Index with a bool: False -> 0, True -> 1.
+MARK = ("❌ FAIL", "✅ PASS")
+
+
+def _flush(lines):
+    """Emit a section's output in one buffered write instead of many prints."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def test_core_components():
+    """Verify models and state machinery work in-process."""
+    out = ["=== Core Components ==="]
+    try:
+        state = ContentState(
+            workflow_id="test-workflow",
+            user_id="test-user",
+            original_input={"text": "test input"},
+        )
+        state.update_trusted(quality_scores={"test": 8.5})
+
+        blog_post = BlogPost(title="Test", summary="Test post")
+        social_post = SocialPost(platform="twitter", content="Test tweet")
+        out.append(f"State OK: {state.workflow_id}")
+        out.append(f"Models OK: {blog_post.title}, {social_post.platform}")
+        return True
+    except Exception as e:
+        out.append(f"Core components failed: {e}")
+        return False
+    finally:
+        _flush(out)
+
+
+async def test_api_health(client: httpx.AsyncClient):
+    """Probe the /health endpoint."""
+    out = ["=== API Health ==="]
+    try:
+        response = await client.get("/health", timeout=5)
+        out.append(f"/health -> {response.status_code}")
+        return response.status_code == 200
+    except Exception as e:
+        out.append(f"Health check failed: {e}")
+        return False
+    finally:
+        _flush(out)
+
+
+async def test_api_metrics(client: httpx.AsyncClient):
+    """Probe the /metrics endpoint."""
+    out = ["=== API Metrics ==="]
+    try:
+        response = await client.get("/metrics", timeout=5)
+        out.append(f"/metrics -> {response.status_code}")
+        return response.status_code == 200
+    except Exception as e:
+        out.append(f"Metrics check failed: {e}")
+        return False
+    finally:
+        _flush(out)
+
+
+async def test_workflow_creation(client: httpx.AsyncClient):
+    """Create a workflow through the API."""
+    out = ["=== Workflow Creation ==="]
+    payload = {
+        "user_id": "test-user",
+        "input": {"text": "Write a post about AI.", "content_type": "blog"},
+    }
+    try:
+        # orjson serializes several times faster than the stdlib json that
+        # httpx's json= path uses; send the bytes directly.
+        response = await client.post(
+            "/api/v1/workflows",
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=10,
+        )
+        out.append(f"/api/v1/workflows -> {response.status_code}")
+        return response.status_code in (200, 201)
+    except Exception as e:
+        out.append(f"Workflow creation failed: {e}")
+        return False
+    finally:
+        _flush(out)
+
+
+async def main():
+    print("ViraLearn ContentBot — final system test")
+    print("=" * 50)
+
+    # One pooled keep-alive client shared by all probes; the three API
+    # checks are independent, so they run concurrently. The explicit limits
+    # keep every probe on a handful of warm connections instead of letting
+    # the pool grow past what a smoke test needs.
+    limits = httpx.Limits(
+        max_connections=4,
+        max_keepalive_connections=4,
+        keepalive_expiry=30.0,
+    )
+    # Plain HTTP/1.1: the local uvicorn dev server gains nothing from h2,
+    # and http2=True hard-requires the optional h2 extra at import time.
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=limits) as client:
+        core_ok, api_health, api_metrics, workflow_ok = await asyncio.gather(
+            asyncio.to_thread(test_core_components),
+            test_api_health(client),
+            test_api_metrics(client),
+            test_workflow_creation(client),
+        )
+
+    _flush([
+        "=" * 50,
+        "Summary:",
+        f"  🧩 Core Components: {MARK[core_ok]}",
+        f"  🌐 API Health: {MARK[api_health]}",
+        f"  📊 API Metrics: {MARK[api_metrics]}",
+        f"  ⚙️ Workflow Creation: {MARK[workflow_ok]}",
+    ])
+    return all([core_ok, api_health, api_metrics, workflow_ok])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,28 @@
+"""Development server with a tuned uvicorn configuration.
+
+Run directly: ``python run_dev_server.py``. Uses the uvloop event loop and
+the httptools HTTP parser, and disables per-request access logging — the
+three cheapest wins for local request throughput.
+"""
+
+
+def main() -> None:
+    import uvicorn
+
+    from config.settings import get_settings
+
+    settings = get_settings()
+    uvicorn.run(
+        "src.api.main:create_app",
+        factory=True,
+        host=settings.api.host,
+        port=settings.api.port,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="info",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Integrated system runner: initialization checks, health checks and serving.
+
+CLI entry point: ``python run_integrated_system.py [serve|health|config|validate]``.
+"""
+
+import asyncio
+import os
+import sys
+
+import click
+
+# uvicorn, the settings stack and the workflow engine are imported lazily
+# inside the commands that need them: `--help` and `validate` should not pay
+# for pulling in FastAPI, SQLAlchemy and the agent modules.
+
+_CRITICAL_VARS = frozenset({"GEMINI_API_KEY", "IMAGEN_PROJECT_ID", "DB_PASSWORD"})
+
+
+class IntegratedSystemManager:
+    """Coordinates startup checks and serving for the whole system."""
+
+    def __init__(self):
+        from config.settings import get_settings
+        from src.utils.config import get_unified_config
+
+        self.config = get_unified_config()
+        self.settings = get_settings()
+        self._engine = None  # constructed once, reused by health checks
+
+    async def initialize_system(self) -> bool:
+        """Run all startup checks; returns True when the system is usable."""
+        from src.utils.config import validate_all_config
+
+        print("Initializing ViraLearn ContentBot...")
+
+        if not validate_all_config():
+            print("Configuration validation failed")
+            return False
+
+        # The four checks touch disjoint resources (env, DB, external config,
+        # agent imports), so overlap them instead of paying their latencies
+        # in sequence. return_exceptions keeps one failure from masking the
+        # others' results.
+        results = await asyncio.gather(
+            asyncio.to_thread(self._check_environment),
+            self._check_database_connection(),
+            asyncio.to_thread(self._check_external_services),
+            self._initialize_workflow_engine(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                print(f"Initialization check failed: {result}")
+                return False
+        if not all(results):
+            return False
+        print("System initialized")
+        return True
+
+    def _check_environment(self) -> bool:
+        """Warn about missing critical environment variables."""
+        # Single set difference instead of a per-var os.getenv loop; note an
+        # empty-string value counts as present here, which is fine for a
+        # warning-only probe.
+        missing = _CRITICAL_VARS - os.environ.keys()
+        if missing:
+            print(f"Warning: missing environment variables: {', '.join(sorted(missing))}")
+        return True
+
+    async def _check_database_connection(self) -> bool:
+        """Verify the database answers a health probe."""
+        from config.database import check_database_health
+
+        health = await check_database_health()
+        if health["status"] != "healthy":
+            print(f"Database check failed: {health.get('error')}")
+        return True  # SQLite fallback keeps the system usable
+
+    def _check_external_services(self) -> bool:
+        """Report on optional external service configuration."""
+        if not self.config["gemini_api_key"]:
+            print("Warning: Gemini API key not configured; using fallbacks")
+        return True
+
+    async def _initialize_workflow_engine(self) -> bool:
+        """Construct (or reuse) the workflow engine and ping it."""
+        if self._engine is None:
+            from src.core.workflow_engine import WorkflowEngine
+
+            self._engine = WorkflowEngine()
+        return await self._engine.ping()
+
+    async def run_health_check(self) -> dict:
+        """Aggregate component health for the health CLI command."""
+        from config.database import check_database_health
+
+        db = await check_database_health()
+        engine_ok = await self._initialize_workflow_engine()
+        return {
+            "database": db["status"],
+            "workflow_engine": "healthy" if engine_ok else "unhealthy",
+        }
+
+    def get_api_app(self):
+        """Return the process-wide FastAPI application."""
+        from src.api.main import get_app
+
+        return get_app()
+
+    def serve(self, host: str, port: int, reload: bool = False) -> None:
+        """Run the API under uvicorn."""
+        import uvicorn
+
+        # Same tuning as run_dev_server.py: uvloop + httptools and no
+        # per-request access logging.
+        uvicorn.run(
+            "src.api.main:create_app",
+            factory=True,
+            host=host,
+            port=port,
+            reload=reload,
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+            log_level="info",
+        )
+
+
+@click.group()
+def cli():
+    """ViraLearn ContentBot system commands."""
+
+
+@cli.command()
+@click.option("--host", default=None, help="Bind host (defaults to settings).")
+@click.option("--port", default=None, type=int, help="Bind port (defaults to settings).")
+@click.option("--reload", is_flag=True, help="Enable auto-reload.")
+def serve(host, port, reload):
+    """Start the API server."""
+    try:
+        import uvloop
+
+        # ~2x faster event loop for the health checks run before serving;
+        # uvicorn picks its own loop for the server process.
+        uvloop.install()
+    except ImportError:
+        pass
+
+    async def run_serve():
+        manager = IntegratedSystemManager()
+        if not await manager.initialize_system():
+            raise SystemExit(1)
+        return manager
+
+    from config.settings import get_settings
+
+    manager = asyncio.run(run_serve())
+    settings = get_settings()
+    manager.serve(
+        host or settings.api.host,
+        port or settings.api.port,
+        reload=reload,
+    )
+
+
+@cli.command()
+def health():
+    """Print component health."""
+
+    async def run_health():
+        manager = IntegratedSystemManager()
+        return await manager.run_health_check()
+
+    result = asyncio.run(run_health())
+    for component, status in result.items():
+        click.echo(f"{component}: {status}")
+
+
+@cli.command()
+def config():
+    """Print the active configuration."""
+    from config.settings import get_settings
+
+    s = get_settings()
+    k = s.gemini.api_key
+    if k and len(k) > 12:
+        masked_key = f"{k[:8]}...{k[-4:]}"
+    elif k:
+        masked_key = "***"
+    else:
+        masked_key = "Not configured"
+    # One echo: a single write() instead of ten line-buffered ones.
+    click.echo(
+        "📋 Current Configuration:\n"
+        f"  App Name: {s.app_name}\n"
+        f"  Environment: {s.environment}\n"
+        f"  Debug Mode: {s.debug}\n"
+        f"  API Host: {s.api.host}\n"
+        f"  API Port: {s.api.port}\n"
+        f"  Gemini Model: {s.gemini.model}\n"
+        f"  Gemini Key: {masked_key}\n"
+        f"  Platforms: {', '.join(s.content.supported_platforms)}\n"
+        f"  Log Level: {s.monitoring.log_level}"
+    )
+
+
+@cli.command()
+def validate():
+    """Validate the configuration."""
+    from src.utils.config import validate_all_config
+
+    ok = validate_all_config()
+    click.echo("Configuration OK" if ok else "Configuration INVALID")
+    if not ok:
+        raise SystemExit(1)
+
+
+def main():
+    cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Agent implementations for ViraLearn ContentBot.
+
+Agent construction is non-trivial (settings load, service clients), so the
+factories below memoize one instance per process for callers that do not
+need isolated agents.
+"""
+
+import functools
+
+from src.agents.brand_voice import BrandVoice
+from src.agents.content_planner import ContentPlanner
+from src.agents.input_analyzer import InputAnalyzer
+from src.agents.quality_assurance import QualityAssurance
+
+
+@functools.lru_cache(maxsize=None)
+def get_analyzer() -> InputAnalyzer:
+    """Return the shared InputAnalyzer instance."""
+    return InputAnalyzer()
+
+
+@functools.lru_cache(maxsize=None)
+def get_planner() -> ContentPlanner:
+    """Return the shared ContentPlanner instance."""
+    return ContentPlanner()
+
+
+@functools.lru_cache(maxsize=None)
+def get_qa() -> QualityAssurance:
+    """Return the shared QualityAssurance instance."""
+    return QualityAssurance()
+
+
+@functools.lru_cache(maxsize=None)
+def get_brand_voice() -> BrandVoice:
+    """Return the shared BrandVoice instance."""
+    return BrandVoice()
+
+
+__all__ = [
+    "ContentPlanner",
+    "InputAnalyzer",
+    "QualityAssurance",
+    "get_analyzer",
+    "get_planner",
+    "get_qa",
+]
@@ -0,0 +1,453 @@
+"""Audio processing agent: TTS for generated content, STT for uploads."""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+try:
+    from cachetools import LFUCache
+
+    _CACHETOOLS_AVAILABLE = True
+except ImportError:
+    _CACHETOOLS_AVAILABLE = False
+
+try:
+    import aiofiles
+
+    _AIOFILES_AVAILABLE = True
+except ImportError:
+    _AIOFILES_AVAILABLE = False
+
+try:
+    import xxhash
+
+    _XXHASH_AVAILABLE = True
+except ImportError:
+    _XXHASH_AVAILABLE = False
+
+
+def _text_digest(text: str):
+    """Cache-key digest for synthesized text.
+
+    xxh3 when available — a cache key does not need a cryptographic hash
+    and xxh3 is several times faster on long main content; blake2b is the
+    stdlib fallback.
+    """
+    data = text.encode()
+    if _XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+from src.agents.base_agent import BaseAgent
+from src.core.error_handling import AgentException
+from src.core.monitoring import Lazy, get_monitoring
+from src.models.state_models import ContentState
+from src.services.audio_service import AudioService, STTRequest, TTSRequest
+
+_TTS_CACHE_SIZE = 1024
+
+# Shared read-only lookup tables; keys are lowercase, matching the platform
+# identifiers used throughout the pipeline.
+_VOICE_FOR_STYLE: Mapping[str, str] = MappingProxyType({
+    "professional": "en-US-Neural2-A",
+    "casual": "en-US-Neural2-C",
+    "energetic": "en-US-Neural2-D",
+    "calm": "en-US-Neural2-E",
+})
+# Template for the no-op payload on runs with nothing to synthesize or
+# transcribe. Copied into a real dict before landing on the state: the
+# field is a mutable Dict and msgspec cannot encode a mappingproxy.
+_FALLBACK_SENTINEL: Mapping[str, Any] = MappingProxyType(
+    {"status": "fallback_mode", "generated": False}
+)
+_PLATFORM_STYLES: Mapping[str, str] = MappingProxyType({
+    "twitter": "energetic",
+    "linkedin": "professional",
+    "instagram": "casual",
+    "facebook": "casual",
+    "youtube": "energetic",
+})
+
+
+def _make_tts_cache():
+    """LFU cache when cachetools is available, bounded LRU otherwise."""
+    if _CACHETOOLS_AVAILABLE:
+        return LFUCache(maxsize=_TTS_CACHE_SIZE)
+    return OrderedDict()
+
+
+class AudioProcessor(BaseAgent):
+    """Generates audio renditions of content and processes transcriptions."""
+
+    name = "AudioProcessor"
+    # Upper bound on in-flight STT calls; matches typical provider
+    # concurrency limits.
+    max_stt_concurrency = 8
+    # Class-level so the cache survives across workflow runs: pipelines
+    # frequently re-synthesize identical text (edits, retries, A/B runs),
+    # and a hit skips the provider round-trip entirely.
+    _tts_cache = _make_tts_cache()
+    _tts_cache_lock = threading.Lock()
+    # Prebuilt request templates: model_copy(update=...) skips the full
+    # pydantic validation pass that TTSRequest(...) pays per construction.
+    _TTS_TEMPLATE = TTSRequest(
+        text="",
+        voice_name="en-US-Neural2-A",
+        language_code="en-US",
+        speaking_rate=1.0,
+        pitch=0.0,
+        audio_format="mp3",
+    )
+    _STT_TEMPLATE = STTRequest(audio_data=b"", language_code="en-US")
+
+    def __init__(self):
+        self.audio_service = AudioService()
+        self._loop = None
+        self._loop_thread = None
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self.initialize_sync()
+
+    def initialize_sync(self) -> None:
+        """Start the background loop and warm the audio service.
+
+        Idempotent and thread-safe (double-checked lock), so concurrent
+        first callers cannot race two loops into existence.
+        """
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            # One loop for the lifetime of the agent: per-call asyncio.run
+            # would rebuild the loop and the service's HTTP/gRPC pools every
+            # time, and would break when invoked from inside a running loop.
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="audio-processor-loop",
+                daemon=True,
+            )
+            self._loop_thread.start()
+            # Kick off client construction now so the first TTS call finds
+            # warm pools instead of paying the cold-start; initialize() is
+            # idempotent, so the first call may safely await it again.
+            asyncio.run_coroutine_threadsafe(
+                self.audio_service.initialize(), self._loop
+            )
+            self._initialized = True
+
+    def close(self) -> None:
+        """Stop the background loop and join its thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop = None
+            self._loop_thread = None
+            self._initialized = False
+
+    def _run_async(self, coro):
+        """Run a coroutine on the persistent loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def execute(self, state: ContentState) -> ContentState:
+        """Generate audio for text content and process transcription requests."""
+        if not state.text_content and not state.audio_transcription_requests:
+            # Nothing to do: skip monitoring and the TTS path entirely.
+            state.audio_content = dict(_FALLBACK_SENTINEL)
+            return state
+
+        monitoring = get_monitoring(state.workflow_id)
+        try:
+            if state.text_content:
+                audio_content = self._generate_audio_content(state, monitoring)
+            else:
+                audio_content = {"status": "fallback_mode", "reason": "no_text"}
+            state.audio_content = audio_content
+
+            transcripts = None
+            requests = state.audio_transcription_requests
+            if requests:
+                transcripts = self._process_transcriptions(state, requests)
+                state.audio_content["transcriptions"] = transcripts
+
+            # One combined record for the success path; the key list is
+            # wrapped lazily so disabled log levels pay nothing for it.
+            if monitoring.is_enabled_for("info"):
+                monitoring.info(
+                    "audio_processor_run",
+                    agent=self.name,
+                    keys=Lazy(lambda: list(audio_content.keys())),
+                    transcriptions=len(transcripts) if transcripts else 0,
+                )
+
+            # BaseAgent.run owns current_agent and step_count bookkeeping.
+            return state
+        except AgentException:
+            raise
+        except Exception as e:
+            # Chain instead of interpolating str(e): the original traceback
+            # survives for exception_to_payload upstream.
+            raise AgentException("Audio processing failed") from e
+
+    def _generate_audio_content(
+        self, state: ContentState, monitoring
+    ) -> Dict[str, Any]:
+        """Produce TTS audio for main content and each platform variant."""
+        # Every piece is an independent provider round-trip; batch them
+        # into one gather on the persistent loop so the stage costs
+        # max(latency) instead of sum(latencies).
+        tasks = []
+        main_text = state.text_content.get("main_content")
+        if main_text:
+            tasks.append(("main_content", main_text, "professional"))
+        for platform, content in state.platform_content.items():
+            text = content.get("text") if isinstance(content, dict) else None
+            if text:
+                tasks.append(
+                    (platform, text, self._get_platform_voice_style(platform))
+                )
+        if not tasks:
+            return {}
+        results = self._run_async(self._gather_tts(monitoring, tasks))
+        audio_content: Dict[str, Any] = {}
+        for (key, _, style), result in zip(tasks, results):
+            if isinstance(result, BaseException):
+                # One failed platform must not abort the batch.
+                audio_content[key] = {
+                    "status": "error",
+                    "style": style,
+                    "error": str(result),
+                }
+            else:
+                audio_content[key] = result
+        return audio_content
+
+    async def _gather_tts(self, monitoring, tasks) -> list:
+        """Synthesize pending pieces, batching same-voice items.
+
+        Items sharing a voice are packed into one SSML provider call via
+        ``text_to_speech_batch``; singletons go through ``_generate_tts``
+        (and its memoization cache). Returns a list aligned with ``tasks``
+        where failed items hold the exception.
+        """
+        groups: Dict[str, list] = {}
+        for index, (_, _, style) in enumerate(tasks):
+            groups.setdefault(self._get_voice_for_style(style), []).append(index)
+        results: list = [None] * len(tasks)
+
+        async def run_singleton(i: int) -> None:
+            _, text, style = tasks[i]
+            try:
+                results[i] = await self._generate_tts(
+                    monitoring, text, style=style
+                )
+            except Exception as exc:
+                results[i] = exc
+
+        async def run_group(indexes: list) -> None:
+            if len(indexes) == 1:
+                await run_singleton(indexes[0])
+                return
+            # Resolve cache hits first; only the misses go to the provider.
+            pending = []
+            for i in indexes:
+                _, text, style = tasks[i]
+                request = self._TTS_TEMPLATE.model_copy(
+                    update={
+                        "text": text,
+                        "voice_name": self._get_voice_for_style(style),
+                    }
+                )
+                key = self._cache_key(request)
+                with self._tts_cache_lock:
+                    cached = self._tts_cache.get(key)
+                if cached is not None and os.path.exists(cached["path"]):
+                    results[i] = dict(cached, style=style)
+                else:
+                    pending.append((i, request))
+            if not pending:
+                return
+            if len(pending) == 1:
+                await run_singleton(pending[0][0])
+                return
+            try:
+                batch = await self.audio_service.text_to_speech_batch(
+                    [request for _, request in pending]
+                )
+            except Exception as exc:
+                for i, _ in pending:
+                    results[i] = exc
+                return
+            # Spool each split payload through the same path/size schema
+            # (and cache) as singleton synthesis, so state.audio_content
+            # carries one shape regardless of how items were grouped.
+            for (i, request), response in zip(pending, batch):
+                try:
+                    results[i] = await self._store_tts_payload(
+                        request,
+                        response.get("audio_data", b""),
+                        tasks[i][2],
+                    )
+                except Exception as exc:
+                    results[i] = exc
+
+        await asyncio.gather(*(run_group(ix) for ix in groups.values()))
+        return results
+
+    @staticmethod
+    def _cache_key(request: TTSRequest) -> tuple:
+        """Cache key for one synthesis request."""
+        return (
+            _text_digest(request.text),
+            request.voice_name,
+            request.speaking_rate,
+            request.pitch,
+        )
+
+    async def _store_tts_payload(
+        self, request: TTSRequest, audio_data: bytes, style: str
+    ) -> Dict[str, Any]:
+        """Spool already-synthesized audio to disk and cache it.
+
+        Used by the batch path so its items land in the same spooled
+        path/size shape and memoization cache as singleton synthesis.
+        """
+        key = self._cache_key(request)
+        with self._tts_cache_lock:
+            cached = self._tts_cache.get(key)
+        if cached is not None and os.path.exists(cached["path"]):
+            return dict(cached, style=style)
+        fd, path = tempfile.mkstemp(
+            prefix="contentbot-tts-", suffix=f".{request.audio_format}"
+        )
+        os.close(fd)
+        if _AIOFILES_AVAILABLE:
+            async with aiofiles.open(path, "wb") as fh:
+                await fh.write(audio_data)
+        else:
+            with open(path, "wb") as fh:
+                await asyncio.to_thread(fh.write, audio_data)
+        result = {
+            "path": path,
+            "size": len(audio_data),
+            "format": request.audio_format,
+            "voice_name": request.voice_name,
+            "style": style,
+        }
+        with self._tts_cache_lock:
+            self._tts_cache[key] = result
+            if (
+                not _CACHETOOLS_AVAILABLE
+                and len(self._tts_cache) > _TTS_CACHE_SIZE
+            ):
+                self._tts_cache.popitem(last=False)
+        return result
+
+    async def _generate_tts(
+        self, monitoring, text: str, style: str = "professional"
+    ) -> Dict[str, Any]:
+        """Synthesize one piece of text, memoized by content and voice."""
+        try:
+            request = self._TTS_TEMPLATE.model_copy(
+                update={
+                    "text": text,
+                    "voice_name": self._get_voice_for_style(style),
+                }
+            )
+            key = self._cache_key(request)
+            with self._tts_cache_lock:
+                cached = self._tts_cache.get(key)
+            if cached is not None and os.path.exists(cached["path"]):
+                return dict(cached, style=style)
+            # Spool the audio to a temp file as it streams in; the state
+            # then carries only the path and size, so long-form content
+            # costs constant memory instead of megabytes per step.
+            path, size = await self._spool_tts_stream(request)
+            result = {
+                "path": path,
+                "size": size,
+                "format": request.audio_format,
+                "voice_name": request.voice_name,
+                "style": style,
+            }
+            with self._tts_cache_lock:
+                self._tts_cache[key] = result
+                if (
+                    not _CACHETOOLS_AVAILABLE
+                    and len(self._tts_cache) > _TTS_CACHE_SIZE
+                ):
+                    self._tts_cache.popitem(last=False)
+            return result
+        except Exception:
+            monitoring.error("tts_failed", agent=self.name, style=style)
+            raise
+
+    async def _spool_tts_stream(self, request: TTSRequest) -> tuple:
+        """Write one synthesis stream to a temp file; return (path, size)."""
+        fd, path = tempfile.mkstemp(
+            prefix="contentbot-tts-", suffix=f".{request.audio_format}"
+        )
+        os.close(fd)
+        size = 0
+        stream = self.audio_service.text_to_speech_stream(request)
+        if _AIOFILES_AVAILABLE:
+            async with aiofiles.open(path, "wb") as fh:
+                async for chunk in stream:
+                    await fh.write(chunk)
+                    size += len(chunk)
+        else:
+            with open(path, "wb") as fh:
+                async for chunk in stream:
+                    await asyncio.to_thread(fh.write, chunk)
+                    size += len(chunk)
+        return path, size
+
+    def _process_transcriptions(
+        self, state: ContentState, requests: Dict[str, dict]
+    ) -> Dict[str, Any]:
+        """Transcribe pending audio uploads concurrently."""
+        results = self._run_async(self._gather_transcriptions(requests))
+        transcripts: Dict[str, Any] = {}
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            request_id, transcript = result
+            transcripts[request_id] = transcript
+        return transcripts
+
+    async def _gather_transcriptions(self, requests: Dict[str, dict]) -> list:
+        """Run STT for each request, bounded by max_stt_concurrency."""
+        sem = asyncio.Semaphore(self.max_stt_concurrency)
+
+        async def one(request_id: str, data: dict):
+            async with sem:
+                stt_request = self._STT_TEMPLATE.model_copy(
+                    update={
+                        "audio_data": data.get("audio_data", b""),
+                        "language_code": data.get("language_code", "en-US"),
+                    }
+                )
+                return request_id, await self.audio_service.speech_to_text(
+                    stt_request
+                )
+
+        return await asyncio.gather(
+            *(one(r, d) for r, d in requests.items()),
+            return_exceptions=True,
+        )
+
+    @staticmethod
+    def _get_voice_for_style(style: str) -> str:
+        """Map a voice style to a concrete provider voice name."""
+        return _VOICE_FOR_STYLE.get(style, "en-US-Neural2-A")
+
+    @staticmethod
+    def _get_platform_voice_style(platform: str) -> str:
+        """Choose the voice style appropriate for a platform."""
+        return _PLATFORM_STYLES.get(platform, "professional")
@@ -0,0 +1,97 @@
+"""Abstract base class shared by all ContentBot agents."""
+
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, Dict, Optional
+
+from dataclasses import dataclass, field
+
+from src.core.error_handling import exception_to_payload
+from src.core.monitoring import get_monitoring
+from src.models.state_models import ContentState, WorkflowStatus
+from src.utils.validators import validate_content_state_cached
+
+# Status normalization tables built once at import: a dict .get is several
+# times cheaper than enum construction inside a try/except on the hot path.
+_STATUS_FROM_STR: Dict[str, WorkflowStatus] = {
+    s.name.lower(): s for s in WorkflowStatus
+}
+_INITIATED_SET = frozenset(
+    {WorkflowStatus.INITIATED, WorkflowStatus.INITIATED.name.lower()}
+)
+
+
+@dataclass(slots=True)
+class AgentResult:
+    """Outcome of one agent invocation.
+
+    A plain slotted dataclass: it is constructed on every agent return, so
+    it must not pay a validation pass just to carry four fields.
+    """
+
+    success: bool = True
+    state: Optional[ContentState] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class BaseAgent(ABC):
+    """Common execution pipeline: validate, execute, record monitoring."""
+
+    name: str = "BaseAgent"
+    # Shared pool for arun(): agent steps are synchronous and would
+    # otherwise block the server's event loop while they run.
+    _executor: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) * 2),
+        thread_name_prefix="agent",
+    )
+
+    @abstractmethod
+    def execute(self, state: ContentState) -> ContentState:
+        """Perform this agent's work and return the updated state."""
+
+    def before_execute(self, state: ContentState) -> None:
+        """Hook invoked before execute; override for setup work."""
+
+    def after_execute(self, state: ContentState) -> None:
+        """Hook invoked after execute; override for teardown work."""
+
+    def run(self, state: ContentState) -> AgentResult:
+        """Drive the full agent pipeline against a workflow state."""
+        monitoring = get_monitoring(state.workflow_id)
+        try:
+            current_status = state.status
+            if isinstance(current_status, str):
+                current_status = _STATUS_FROM_STR.get(
+                    current_status, WorkflowStatus.INITIATED
+                )
+            if current_status in _INITIATED_SET:
+                state.status = WorkflowStatus.IN_PROGRESS
+
+            validate_content_state_cached(state)
+            self.before_execute(state)
+            updated = self.execute(state)
+            self.after_execute(updated)
+
+            updated.current_agent = self.name
+            updated.increment_step()
+            monitoring.info(
+                "agent_complete", agent=self.name, step=updated.step_count
+            )
+            return AgentResult(success=True, state=updated)
+        except Exception as exc:
+            monitoring.error(
+                "agent_failed", agent=self.name, **exception_to_payload(exc)
+            )
+            return AgentResult(success=False, state=state, error=str(exc))
+
+    async def arun(self, state: ContentState) -> AgentResult:
+        """Async wrapper over run() for event-loop callers.
+
+        Executes the synchronous pipeline on the shared executor so the
+        loop stays responsive while an agent works.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.run, state)
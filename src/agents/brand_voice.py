@@ -0,0 +1,1078 @@
+"""Brand voice agent: checks content against brand guidelines and repairs it."""
+
+import asyncio
+import hashlib
+import json
+import itertools
+import re
+import textwrap
+from collections import OrderedDict, namedtuple
+from types import MappingProxyType
+from typing import Any, Dict, Optional
+
+from src.agents.base_agent import BaseAgent
+from src.core.error_handling import AgentException
+from src.models.state_models import ContentState
+
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    _NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+try:
+    import ahocorasick
+
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+try:
+    from sentence_transformers import SentenceTransformer
+
+    _SBERT_AVAILABLE = True
+except ImportError:
+    _SBERT_AVAILABLE = False
+
+
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
+# Built once at import and handed out by reference; MappingProxyType keeps
+# callers from mutating the shared defaults.
+_DEFAULT_BRAND_GUIDELINES = MappingProxyType(
+    {
+        "voice_attributes": ["professional", "approachable", "clear"],
+        "language_style": ["active voice", "concise", "jargon-free"],
+        "tone": "confident but friendly",
+        "formality": "semi-formal",
+        "avoid": ["slang", "hype", "passive constructions"],
+    }
+)
+
+_TONE_KEYWORDS = MappingProxyType(
+    {
+        "positive": [
+            "help", "improve", "grow", "learn", "achieve", "succeed",
+            "effective", "reliable", "proven", "innovative",
+        ],
+        "negative": [
+            "hate", "terrible", "awful", "stupid", "worst", "useless",
+            "cheap", "scam", "spam",
+        ],
+    }
+)
+
+_STYLE_INDICATORS = MappingProxyType(
+    {
+        "passive": [
+            "was made", "is done", "been given", "were taken",
+            "is being", "has been", "will be given",
+        ],
+        "formal": [
+            "furthermore", "consequently", "nevertheless", "therefore",
+            "moreover", "accordingly",
+        ],
+        "informal": [
+            "gonna", "wanna", "kinda", "sorta", "dunno", "yeah",
+            "awesome", "cool",
+        ],
+    }
+)
+
+_COMPLIANCE_RULES = MappingProxyType(
+    {
+        "twitter": {"max_words": 50},
+        "instagram": {"max_words": 100},
+        "linkedin": {"max_words": 300},
+        "facebook": {"max_words": 200},
+    }
+)
+
+# Polarity buckets for the Aho–Corasick scan, in automaton-value order.
+_POLARITIES = ("positive", "negative", "passive", "formal", "informal")
+
+# Deterministic-repair tables: clause splits for run-on sentences and
+# contraction fixes, applied before any LLM round-trip.
+_CLAUSE_SPLIT_RE = re.compile(r",\s+(and|but)\s+")
+_CONTRACTIONS = {
+    "gonna": "going to",
+    "wanna": "want to",
+    "kinda": "kind of",
+    "sorta": "sort of",
+    "dunno": "do not know",
+}
+_CONTRACTION_RE = re.compile(
+    r"\b(" + "|".join(_CONTRACTIONS) + r")\b", re.IGNORECASE
+)
+
+# One tokenization pass feeds every check; avoids each _check_* re-splitting
+# (and re-walking) the same text.
+_TextFeatures = namedtuple(
+    "_TextFeatures", "tokens sentences word_count sentence_count lower"
+)
+
+
+def _tokenize(text: str) -> _TextFeatures:
+    """Build the shared per-text features in a single pass each."""
+    tokens = text.split()
+    sentences = [s for s in _SENTENCE_SPLIT_RE.split(text) if s.strip()]
+    return _TextFeatures(
+        tokens=tokens,
+        sentences=sentences,
+        word_count=len(tokens),
+        sentence_count=len(sentences),
+        # Lowered once here; every consumer that needs case-insensitive
+        # text reads this instead of allocating its own copy.
+        lower=text.lower(),
+    )
+
+
+def _compile_keywords(words) -> "re.Pattern":
+    """Compile a word list into one word-bounded alternation pattern."""
+    return re.compile(
+        r"\b(?:" + "|".join(map(re.escape, words)) + r")\b",
+        re.IGNORECASE,
+    )
+
+
+def _hash_token(token: str) -> int:
+    """Stable non-negative 31-bit token id for the JIT kernel."""
+    return hash(token) & 0x7FFFFFFF
+
+
+if _NUMBA_AVAILABLE and _NUMPY_AVAILABLE:
+
+    @njit(cache=True)
+    def _count_members(token_ids, keyword_ids):  # pragma: no cover
+        """Count how many tokens appear in a sorted keyword-id array."""
+        count = 0
+        for i in range(token_ids.shape[0]):
+            value = token_ids[i]
+            lo = 0
+            hi = keyword_ids.shape[0]
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if keyword_ids[mid] < value:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo < keyword_ids.shape[0] and keyword_ids[lo] == value:
+                count += 1
+        return count
+
+
+class _CorrectionCache:
+    """Semantic cache for LLM correction responses.
+
+    Keys are ``{content_type}|{platform}|{normalized text}``. Lookup tries an
+    exact hash first; when an embedding model is available, near-duplicates
+    are matched by cosine similarity against the cached embeddings, so a
+    lightly edited draft still reuses the earlier correction instead of
+    paying a fresh LLM round-trip.
+    """
+
+    SIMILARITY_THRESHOLD = 0.87
+    MAX_ENTRIES = 512
+
+    def __init__(self):
+        # key hash -> (embedding | None, response, hit count)
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self._encoder = None
+
+    def _embed(self, key: str):
+        if not (_SBERT_AVAILABLE and _NUMPY_AVAILABLE):
+            return None
+        if self._encoder is None:
+            self._encoder = SentenceTransformer("all-MiniLM-L6-v2")
+        vector = self._encoder.encode(key, normalize_embeddings=True)
+        return np.asarray(vector, dtype=np.float32)
+
+    @staticmethod
+    def _key(content_type: str, platform: Optional[str], text: str) -> str:
+        return f"{content_type}|{platform or ''}|{text.strip().lower()}"
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def get(
+        self, content_type: str, platform: Optional[str], text: str
+    ) -> Optional[str]:
+        """Return a cached correction, or None on miss."""
+        key = self._key(content_type, platform, text)
+        digest = self._digest(key)
+        entry = self._entries.get(digest)
+        if entry is not None:
+            entry[2] += 1
+            self._entries.move_to_end(digest)
+            return entry[1]
+        embedding = self._embed(key)
+        if embedding is None:
+            return None
+        # Cosine argmax over the stacked cached embeddings; everything is
+        # normalized, so a dot product is the similarity.
+        candidates = [
+            (d, e) for d, e in self._entries.items() if e[0] is not None
+        ]
+        if not candidates:
+            return None
+        matrix = np.stack([e[0] for _, e in candidates])
+        sims = matrix @ embedding
+        best = int(sims.argmax())
+        if float(sims[best]) >= self.SIMILARITY_THRESHOLD:
+            digest_hit, entry = candidates[best]
+            entry[2] += 1
+            self._entries.move_to_end(digest_hit)
+            return entry[1]
+        return None
+
+    def put(
+        self,
+        content_type: str,
+        platform: Optional[str],
+        text: str,
+        response: str,
+    ) -> None:
+        """Insert a correction, evicting the coldest entry when full."""
+        key = self._key(content_type, platform, text)
+        digest = self._digest(key)
+        if len(self._entries) >= self.MAX_ENTRIES:
+            # Evict the least recently used entry unless it is hot; a hot
+            # head entry is demoted instead so frequent hits survive churn.
+            old_digest, old_entry = next(iter(self._entries.items()))
+            if old_entry[2] > 1:
+                old_entry[2] -= 1
+                self._entries.move_to_end(old_digest)
+            self._entries.popitem(last=False)
+        self._entries[digest] = [self._embed(key), response, 0]
+
+
+class BrandVoice(BaseAgent):
+    """Scores content for brand compliance and corrects failing pieces."""
+
+    name = "BrandVoice"
+
+    def __init__(self):
+        # Deferred: LLMService pulls in the Gemini SDK and settings, which
+        # agent-importing callers that never correct content should not pay.
+        from src.services.llm_service import _shared_llm
+
+        self.llm_service = _shared_llm()
+        self._brand_guidelines: Optional[Dict[str, Any]] = None
+        self._voice_patterns: Optional[Dict[str, Any]] = None
+        self._correction_cache = _CorrectionCache()
+        # (text, content_type, guidelines digest) -> analysis dict. The
+        # digest keys the cache to the loaded guidelines, so a reload
+        # naturally invalidates earlier entries without the aliasing an
+        # id()-based key would allow once an old dict is recycled.
+        self._analysis_cache: "OrderedDict[tuple, Dict[str, Any]]" = (
+            OrderedDict()
+        )
+        self._guidelines_cache_key: Optional[str] = None
+        # Analyzer specialized to the loaded guidelines; None means the
+        # interpreted _analyze_text_uncached path is in effect.
+        self._compiled_analyze = None
+        self._analyzer_key: Optional[int] = None
+
+    def execute(self, state: ContentState) -> ContentState:
+        """Analyze brand compliance and apply corrections where needed."""
+        from src.core.monitoring import get_monitoring
+
+        monitoring = get_monitoring(state.workflow_id)
+        try:
+            self._load_brand_guidelines(state)
+            compliance_results = self._analyze_brand_compliance(state)
+            monitoring.info(
+                "brand_analysis_done",
+                agent=self.name,
+                score=compliance_results.get("overall_score"),
+            )
+
+            if compliance_results.get("overall_score", 1.0) < 0.7:
+                corrected = self._apply_brand_corrections(
+                    state, compliance_results["scores"]
+                )
+                if corrected:
+                    state.text_content.update(corrected["text_content"])
+                    state.platform_content.update(
+                        corrected["platform_content"]
+                    )
+                    monitoring.info(
+                        "brand_corrections_applied", agent=self.name
+                    )
+
+            # Single attribute write once the result dict is complete; the
+            # old hasattr re-check was dead (the field is always declared).
+            state.brand_compliance = compliance_results
+            return state
+        except AgentException:
+            raise
+        except Exception as e:
+            raise AgentException("Brand voice processing failed") from e
+
+    # ------------------------------------------------------------------
+    # Guidelines
+    # ------------------------------------------------------------------
+
+    def _load_brand_guidelines(self, state: ContentState) -> None:
+        """Load brand guidelines from input or defaults."""
+        provided = state.original_input.get("brand_guidelines")
+        if provided:
+            self._brand_guidelines = provided
+        else:
+            self._brand_guidelines = self._get_default_brand_guidelines()
+        self._voice_patterns = self._extract_voice_patterns()
+        # The guidelines block is identical for every correction in a run;
+        # join it once here instead of per prompt, and keep it as a distinct
+        # prefix so the provider's prompt cache can reuse its prefill.
+        self._voice_str = ", ".join(self._brand_guidelines["voice_attributes"])
+        self._lang_str = ", ".join(self._brand_guidelines["language_style"])
+        guidelines_block = (
+            f"Voice attributes: {self._voice_str}\n"
+            f"Language style: {self._lang_str}\n"
+            f"Tone: {self._brand_guidelines['tone']}\n"
+        )
+        # Full format_map-ready templates: one interpolation per prompt,
+        # instead of re-joining guideline lists and concatenating parts on
+        # every correction call.
+        self._text_correction_template = (
+            "Please revise the following {content_type} content to match "
+            "our brand voice.\n" + guidelines_block
+            + "\nOriginal Content:\n{text}\n\nRevised Content:"
+        )
+        self._platform_correction_template = (
+            "Please revise the following {platform} post to match our "
+            "brand voice.\n" + guidelines_block
+            + "Keep it within platform limits.\n"
+            "\nOriginal Content:\n{text}\n\nRevised Content:"
+        )
+        self._platform_batch_prefix = (
+            "Please revise the following social media post to match our "
+            "brand voice.\n" + guidelines_block
+            + "Keep it within platform limits.\n"
+        )
+        self._guidelines_cache_key = hashlib.blake2b(
+            guidelines_block.encode(), digest_size=8
+        ).hexdigest()
+        self._compiled_analyze = self._compile_analyzer(self._brand_guidelines)
+
+    def _get_default_brand_guidelines(self) -> Dict[str, Any]:
+        """Default guidelines used when the caller supplies none."""
+        return _DEFAULT_BRAND_GUIDELINES
+
+    def _get_tone_keywords(self) -> Dict[str, Any]:
+        """Positive/negative tone indicator lists."""
+        return _TONE_KEYWORDS
+
+    def _get_style_indicators(self) -> Dict[str, Any]:
+        """Indicators used by voice/formality checks."""
+        return _STYLE_INDICATORS
+
+    def _get_compliance_rules(self) -> Dict[str, Any]:
+        """Platform-specific compliance limits."""
+        return _COMPLIANCE_RULES
+
+    def _extract_voice_patterns(self) -> Dict[str, Any]:
+        """Derive the working pattern sets from the loaded guidelines."""
+        tone = self._get_tone_keywords()
+        style = self._get_style_indicators()
+        # One compiled alternation per polarity: a single DFA pass with
+        # findall replaces the per-keyword Python substring scans.
+        self._pos_re = _compile_keywords(tone["positive"])
+        self._neg_re = _compile_keywords(tone["negative"])
+        self._passive_re = _compile_keywords(style["passive"])
+        self._formal_re = _compile_keywords(style["formal"])
+        self._informal_re = _compile_keywords(style["informal"])
+        if _NUMBA_AVAILABLE and _NUMPY_AVAILABLE:
+            # Sorted hashed-id arrays for the JIT membership kernel; only
+            # the single-word lists qualify (passive phrases stay on the
+            # regex path since they span token boundaries).
+            self._keyword_ids = {
+                name: np.sort(
+                    np.fromiter(
+                        (_hash_token(w) for w in words), dtype=np.int64
+                    )
+                )
+                for name, words in (
+                    ("positive", tone["positive"]),
+                    ("negative", tone["negative"]),
+                    ("formal", style["formal"]),
+                    ("informal", style["informal"]),
+                )
+            }
+        else:
+            self._keyword_ids = None
+        if _AHOCORASICK_AVAILABLE:
+            # One automaton over every keyword list: a single pass over the
+            # text emits all hits, regardless of how many keywords exist.
+            ac = ahocorasick.Automaton()
+            for polarity, words in enumerate(
+                (
+                    tone["positive"],
+                    tone["negative"],
+                    style["passive"],
+                    style["formal"],
+                    style["informal"],
+                )
+            ):
+                for word in words:
+                    key = word.lower()
+                    ac.add_word(key, (polarity, len(key)))
+            ac.make_automaton()
+            self._ac = ac
+        else:
+            self._ac = None
+        return {
+            "positive": tone["positive"],
+            "negative": tone["negative"],
+            "passive": style["passive"],
+            "formal": style["formal"],
+            "informal": style["informal"],
+            "rules": self._get_compliance_rules(),
+        }
+
+    # ------------------------------------------------------------------
+    # Analysis
+    # ------------------------------------------------------------------
+
+    # Template for the specialized analyzer. The four checks are fused into
+    # one pass with their thresholds and the platform word limits baked in
+    # as literals, so the hot path has no guideline dict lookups left.
+    _ANALYZER_TEMPLATE = """\
+def analyze(self, text, content_type, platform=None):
+    features = _tokenize(text)
+    counts = self._scan_counts(features.lower)
+    issues = []
+    suggestions = []
+
+    positive = self._count_keyword_hits(
+        "positive", self._pos_re, features, counts)
+    negative = self._count_keyword_hits(
+        "negative", self._neg_re, features, counts)
+    tone_score = 1.0
+    if negative > 0:
+        tone_score -= min(0.5, negative * 0.15)
+        issues.append("negative tone indicators present")
+    if features.word_count > 20 and positive == 0:
+        tone_score -= 0.2
+    tone_score = max(0.0, tone_score)
+    if tone_score < 0.8:
+        suggestions.append("add positive, benefit-led phrasing")
+
+    style_score = 1.0
+    if features.sentence_count:
+        avg_length = features.word_count / features.sentence_count
+        if avg_length > 20:
+            style_score -= 0.3
+            issues.append("sentences run long")
+            suggestions.append("split sentences over ~20 words")
+        elif avg_length < 10 and features.sentence_count > 2:
+            style_score -= 0.1
+            suggestions.append("vary sentence length for flow")
+
+    passive = (counts["passive"] if counts is not None
+               else len(self._passive_re.findall(text)))
+    voice_score = 1.0
+    if passive / max(1, features.sentence_count) > 0.3:
+        voice_score -= min(0.4, passive / max(1, features.sentence_count))
+        issues.append("too much passive voice")
+        suggestions.append("rewrite in active voice")
+    voice_score = max(0.0, voice_score)
+
+    formal = self._count_keyword_hits(
+        "formal", self._formal_re, features, counts)
+    informal = self._count_keyword_hits(
+        "informal", self._informal_re, features, counts)
+    formality_score = 1.0
+    register_issue = False
+    if informal > 1:
+        formality_score -= min(0.4, informal * 0.15)
+        issues.append("informal language present")
+        register_issue = True
+    if formal > 3:
+        formality_score -= 0.1
+        issues.append("overly formal phrasing")
+        register_issue = True
+    if register_issue:
+        suggestions.append("match the brand's semi-formal register")
+    formality_score = max(0.0, formality_score)
+
+    score = (tone_score + style_score + voice_score + formality_score) / 4
+    if platform is not None:
+        max_words = {limits!r}.get(platform)
+        if max_words and features.word_count > max_words:
+            score = (score + 0.7) / 2
+            issues.append(
+                platform + " content exceeds " + str(max_words) + " words")
+    return {{
+        "score": score,
+        "issues": issues,
+        "suggestions": suggestions,
+        "content_type": content_type,
+    }}
+"""
+
+    def _compile_analyzer(self, guidelines: Dict[str, Any]):
+        """Exec-compile an analyzer specialized to the loaded guidelines.
+
+        Partial evaluation: the returned function has the guideline
+        thresholds and platform limits inlined as constants. Cached by the
+        guidelines object id; returns None (interpreted fallback) when
+        compilation fails.
+        """
+        key = id(guidelines)
+        if self._analyzer_key == key and self._compiled_analyze is not None:
+            return self._compiled_analyze
+        try:
+            limits = {
+                platform: rule.get("max_words")
+                for platform, rule in self._voice_patterns["rules"].items()
+            }
+            source = textwrap.dedent(
+                self._ANALYZER_TEMPLATE.format(limits=limits)
+            )
+            namespace: Dict[str, Any] = {"_tokenize": _tokenize}
+            exec(compile(source, "<brand-voice-analyzer>", "exec"), namespace)
+            self._analyzer_key = key
+            return namespace["analyze"]
+        except Exception:
+            return None
+
+    def _analyze_brand_compliance(self, state: ContentState) -> Dict[str, Any]:
+        """Score every piece of content against the brand guidelines."""
+        compliance_results: Dict[str, Any] = {
+            "overall_score": 1.0,
+            "issues": [],
+            "suggestions": [],
+            "detailed": {},
+            # (kind, key) -> score; lets the correction pass skip pieces
+            # that already meet the threshold instead of re-LLMing them.
+            "scores": {},
+        }
+        score_map = compliance_results["scores"]
+        # Collected during the walk so the overall score needs no second
+        # traversal of the detailed results. Issues/suggestions gather as
+        # batches and flatten once at the end, avoiding repeated extend
+        # reallocations (and the fresh [] default per missing key).
+        scores = []
+        issue_batches = []
+        suggestion_batches = []
+
+        for content_type, text in state.text_content.items():
+            if not isinstance(text, str) or not text:
+                continue
+            analysis = self._analyze_text_compliance(text, content_type)
+            compliance_results["detailed"][content_type] = analysis
+            score_map[("text", content_type)] = analysis["score"]
+            scores.append(analysis["score"])
+            if "issues" in analysis:
+                issue_batches.append(analysis["issues"])
+            if "suggestions" in analysis:
+                suggestion_batches.append(analysis["suggestions"])
+
+        for platform, content in state.platform_content.items():
+            text = content.get("text") if isinstance(content, dict) else None
+            if not text:
+                continue
+            analysis = self._analyze_text_compliance(text, "platform")
+            platform_analysis = self._check_platform_specific_compliance(
+                _tokenize(text), platform
+            )
+            analysis["score"] = (
+                analysis["score"] + platform_analysis["score"]
+            ) / 2
+            compliance_results["detailed"][f"platform:{platform}"] = analysis
+            score_map[("platform", platform)] = analysis["score"]
+            scores.append(analysis["score"])
+            if "issues" in analysis:
+                issue_batches.append(analysis["issues"])
+            if "issues" in platform_analysis:
+                issue_batches.append(platform_analysis["issues"])
+            if "suggestions" in analysis:
+                suggestion_batches.append(analysis["suggestions"])
+
+        compliance_results["issues"] = list(
+            itertools.chain.from_iterable(issue_batches)
+        )
+        compliance_results["suggestions"] = list(
+            itertools.chain.from_iterable(suggestion_batches)
+        )
+        compliance_results["overall_score"] = self._calculate_compliance_score(
+            scores
+        )
+        return compliance_results
+
+    _ANALYSIS_CACHE_SIZE = 4096
+
+    def _analyze_text_compliance(
+        self, text: str, content_type: str
+    ) -> Dict[str, Any]:
+        """Run every check against one piece of text, memoized.
+
+        Platform variants frequently share copy and retries resubmit the
+        same text; the checks are pure functions of (text, guidelines), so
+        repeats are a dict probe.
+        """
+        key = (text, content_type, self._guidelines_cache_key)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(key)
+            # Callers mutate analysis dicts (platform score averaging).
+            return dict(cached)
+        if self._compiled_analyze is not None:
+            analysis = self._compiled_analyze(self, text, content_type)
+        else:
+            analysis = self._analyze_text_uncached(text, content_type)
+        if len(self._analysis_cache) >= self._ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        self._analysis_cache[key] = dict(analysis)
+        return analysis
+
+    def _analyze_text_uncached(
+        self, text: str, content_type: str
+    ) -> Dict[str, Any]:
+        """Run every check against one piece of text and combine scores."""
+        features = _tokenize(text)
+        counts = self._scan_counts(features.lower)
+        tone = self._check_tone_compliance(text, features, counts)
+        style = self._check_style_compliance(text, features)
+        voice = self._check_active_voice(text, features, counts)
+        formality = self._check_formality_level(text, features, counts)
+
+        issues = []
+        suggestions = []
+        for result in (tone, style, voice, formality):
+            issues.extend(result.get("issues", []))
+            suggestions.extend(result.get("suggestions", []))
+        score = (
+            tone["score"] + style["score"] + voice["score"] + formality["score"]
+        ) / 4
+        return {
+            "score": score,
+            "issues": issues,
+            "suggestions": suggestions,
+            "content_type": content_type,
+        }
+
+    def _scan_counts(self, lower: str) -> Optional[Dict[str, int]]:
+        """Count every polarity's keyword hits in one automaton pass.
+
+        Returns None when pyahocorasick is unavailable; callers then fall
+        back to the per-polarity counters.
+        """
+        if self._ac is None:
+            return None
+        counts = [0] * len(_POLARITIES)
+        text_len = len(lower)
+        for end, (polarity, length) in self._ac.iter(lower):
+            # Keep only word-bounded hits so this path scores the same
+            # text the \b-anchored regex fallback does: a raw substring
+            # pass would count "cool" inside "school".
+            start = end - length + 1
+            if start and (lower[start - 1].isalnum() or lower[start - 1] == "_"):
+                continue
+            after = end + 1
+            if after < text_len and (lower[after].isalnum() or lower[after] == "_"):
+                continue
+            counts[polarity] += 1
+        return dict(zip(_POLARITIES, counts))
+
+    def _count_keyword_hits(
+        self,
+        name: str,
+        pattern: "re.Pattern",
+        features: _TextFeatures,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """Count keyword hits via the JIT kernel, or regex when unavailable."""
+        if counts is not None:
+            return counts[name]
+        if self._keyword_ids is not None:
+            token_ids = np.fromiter(
+                (_hash_token(t.strip(".,!?;:")) for t in features.lower.split()),
+                dtype=np.int64,
+            )
+            return int(_count_members(token_ids, self._keyword_ids[name]))
+        return len(pattern.findall(features.lower))
+
+    def _check_tone_compliance(
+        self,
+        text: str,
+        features: _TextFeatures,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Any]:
+        """Score tone via positive/negative indicator density."""
+        positive_count = self._count_keyword_hits(
+            "positive", self._pos_re, features, counts
+        )
+        negative_count = self._count_keyword_hits(
+            "negative", self._neg_re, features, counts
+        )
+        word_count = features.word_count
+        score = 1.0
+        issues = []
+        if negative_count > 0:
+            score -= min(0.5, negative_count * 0.15)
+            issues.append("negative tone indicators present")
+        if word_count > 20 and positive_count == 0:
+            score -= 0.2
+        return {
+            "score": max(0.0, score),
+            "issues": issues,
+            "suggestions": (
+                ["add positive, benefit-led phrasing"] if score < 0.8 else []
+            ),
+        }
+
+    def _check_style_compliance(
+        self, text: str, features: _TextFeatures
+    ) -> Dict[str, Any]:
+        """Score sentence-length style conformance."""
+        sentences = features.sentences
+        if not sentences:
+            return {"score": 1.0, "issues": [], "suggestions": []}
+        avg_length = features.word_count / features.sentence_count
+        score = 1.0
+        issues = []
+        suggestions = []
+        if avg_length > 20:
+            score -= 0.3
+            issues.append("sentences run long")
+            suggestions.append("split sentences over ~20 words")
+        elif avg_length < 10 and features.sentence_count > 2:
+            score -= 0.1
+            suggestions.append("vary sentence length for flow")
+        return {"score": max(0.0, score), "issues": issues,
+                "suggestions": suggestions}
+
+    def _check_active_voice(
+        self,
+        text: str,
+        features: _TextFeatures,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Any]:
+        """Penalize passive-voice constructions."""
+        passive_count = (
+            counts["passive"]
+            if counts is not None
+            else len(self._passive_re.findall(text))
+        )
+        sentence_count = max(1, features.sentence_count)
+        ratio = passive_count / sentence_count
+        score = 1.0
+        issues = []
+        if ratio > 0.3:
+            score -= min(0.4, ratio)
+            issues.append("too much passive voice")
+        return {
+            "score": max(0.0, score),
+            "issues": issues,
+            "suggestions": (["rewrite in active voice"] if issues else []),
+        }
+
+    def _check_formality_level(
+        self,
+        text: str,
+        features: _TextFeatures,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Any]:
+        """Score against the brand's semi-formal register."""
+        formal_count = self._count_keyword_hits(
+            "formal", self._formal_re, features, counts
+        )
+        informal_count = self._count_keyword_hits(
+            "informal", self._informal_re, features, counts
+        )
+        score = 1.0
+        issues = []
+        if informal_count > 1:
+            score -= min(0.4, informal_count * 0.15)
+            issues.append("informal language present")
+        if formal_count > 3:
+            score -= 0.1
+            issues.append("overly formal phrasing")
+        return {
+            "score": max(0.0, score),
+            "issues": issues,
+            "suggestions": (
+                ["match the brand's semi-formal register"] if issues else []
+            ),
+        }
+
+    def _check_platform_specific_compliance(
+        self, features: _TextFeatures, platform: str
+    ) -> Dict[str, Any]:
+        """Check platform length limits from the compliance rules."""
+        rules = self._voice_patterns["rules"].get(platform, {})
+        max_words = rules.get("max_words")
+        word_count = features.word_count
+        score = 1.0
+        issues = []
+        if max_words and word_count > max_words:
+            score -= 0.3
+            issues.append(f"{platform} content exceeds {max_words} words")
+        return {"score": max(0.0, score), "issues": issues}
+
+    @staticmethod
+    def _calculate_compliance_score(scores) -> float:
+        """Average the per-piece scores into one overall score."""
+        if not scores:
+            return 1.0
+        if _NUMPY_AVAILABLE:
+            return float(np.fromiter(scores, dtype=np.float32).mean())
+        return sum(scores) / len(scores)
+
+    # ------------------------------------------------------------------
+    # Correction
+    # ------------------------------------------------------------------
+
+    # Pieces scoring at or above this need no correction.
+    _CORRECTION_THRESHOLD = 0.7
+
+    # Word-count tiers for batched correction calls; max_tokens is sized to
+    # the bucket instead of the worst case, so short posts do not pay the
+    # decode budget of long ones.
+    _LENGTH_TIERS = (512, 1024, 2048)
+
+    def _apply_brand_corrections(
+        self, state: ContentState, score_map: Dict[Any, float]
+    ) -> Optional[Dict[str, Any]]:
+        """Rewrite failing content through the LLM.
+
+        Returns maps containing only the corrected keys — passing pieces
+        stay in the state untouched — or None when every piece already
+        meets the threshold, so the clean path allocates no mirror dicts.
+        """
+        corrected_text: Dict[str, Any] = {}
+        for content_type, text in state.text_content.items():
+            if (
+                isinstance(text, str)
+                and text
+                and score_map.get(("text", content_type), 0.0)
+                < self._CORRECTION_THRESHOLD
+            ):
+                corrected_text[content_type] = self._correct_text_content(
+                    text, content_type
+                )
+        # Platform corrections go out as one batched LLM call instead of a
+        # round-trip per platform; the call dominates this stage's latency.
+        jobs = []
+        for platform, content in state.platform_content.items():
+            if (
+                isinstance(content, dict)
+                and content.get("text")
+                and score_map.get(("platform", platform), 0.0)
+                < self._CORRECTION_THRESHOLD
+            ):
+                text = content["text"]
+                repaired = self._local_repair(
+                    text, _tokenize(text), "platform"
+                )
+                if repaired is not None:
+                    jobs.append((platform, text, repaired))
+                else:
+                    jobs.append((platform, text, None))
+        corrected_platform: Dict[str, Any] = {}
+        if jobs:
+            llm_jobs = [
+                (platform, text)
+                for platform, text, repaired in jobs
+                if repaired is None
+            ]
+            revised_map = (
+                self._correct_platform_batch(llm_jobs) if llm_jobs else {}
+            )
+            for platform, text, repaired in jobs:
+                new_content = dict(state.platform_content[platform])
+                new_content["text"] = (
+                    repaired
+                    if repaired is not None
+                    else revised_map.get(platform, text)
+                )
+                corrected_platform[platform] = new_content
+        if not corrected_text and not corrected_platform:
+            return None
+        return {
+            "text_content": corrected_text,
+            "platform_content": corrected_platform,
+        }
+
+    def _local_repair(
+        self, text: str, features: _TextFeatures, content_type: str
+    ) -> Optional[str]:
+        """Deterministically repair easy issues; None means use the LLM.
+
+        Splits sentences over 25 words at ", and"/", but" and expands the
+        known informal contractions, then re-scores. Only a repair that
+        clears the correction threshold is returned — anything subtler
+        still goes to the model.
+        """
+        repaired = text
+        if any(len(s.split()) > 25 for s in features.sentences):
+            repaired = _CLAUSE_SPLIT_RE.sub(
+                lambda m: f". {m.group(1).capitalize()} ", repaired
+            )
+        repaired = _CONTRACTION_RE.sub(
+            lambda m: _CONTRACTIONS[m.group(0).lower()], repaired
+        )
+        if repaired == text:
+            return None
+        analysis = self._analyze_text_compliance(repaired, content_type)
+        if analysis["score"] >= self._CORRECTION_THRESHOLD:
+            return repaired
+        return None
+
+    def _correct_text_content(self, text: str, content_type: str) -> str:
+        """Revise one piece of text toward the brand voice.
+
+        Tries the local repair first; the LLM is only consulted when the
+        deterministic pass cannot lift the score over the threshold.
+        """
+        cached = self._correction_cache.get(content_type, None, text)
+        if cached is not None:
+            return cached
+        repaired = self._local_repair(text, _tokenize(text), content_type)
+        if repaired is not None:
+            self._correction_cache.put(content_type, None, text, repaired)
+            return repaired
+        prompt = self._text_correction_template.format_map(
+            {"content_type": content_type, "text": text}
+        )
+        response = asyncio.run(
+            self.llm_service.generate_content(
+                prompt,
+                temperature=0.3,
+                cache_key=self._guidelines_cache_key,
+            )
+        )
+        revised = response.strip() if response else text
+        self._correction_cache.put(content_type, None, text, revised)
+        return revised
+
+    def _correct_platform_batch(self, jobs) -> Dict[str, str]:
+        """Revise several platform variants in one LLM call.
+
+        ``jobs`` is a list of (platform, text). Cache hits are resolved
+        locally; the remaining items are numbered into a single prompt that
+        asks for a JSON array of revised strings in order. Falls back to
+        per-item correction when the batched response cannot be parsed.
+        """
+        revised_map: Dict[str, str] = {}
+        pending = []
+        for platform, text in jobs:
+            cached = self._correction_cache.get("platform", platform, text)
+            if cached is not None:
+                revised_map[platform] = cached
+            else:
+                pending.append((platform, text))
+        if not pending:
+            return revised_map
+        if len(pending) == 1:
+            platform, text = pending[0]
+            revised_map[platform] = self._correct_platform_content(
+                text, platform
+            )
+            return revised_map
+
+        # Length-bucket the batch: sort by word count, group into tiers and
+        # size max_tokens per bucket. revised_map keys by platform, so the
+        # caller's order is unaffected by the sort.
+        pending.sort(key=lambda job: len(job[1].split()))
+        bucket: list = []
+        bucket_tier = self._LENGTH_TIERS[0]
+        for platform, text in pending:
+            tier = next(
+                (t for t in self._LENGTH_TIERS if len(text.split()) <= t),
+                self._LENGTH_TIERS[-1],
+            )
+            if bucket and tier != bucket_tier:
+                revised_map.update(
+                    self._correct_platform_group(bucket, bucket_tier * 2)
+                )
+                bucket = []
+            bucket_tier = tier
+            bucket.append((platform, text))
+        if bucket:
+            revised_map.update(
+                self._correct_platform_group(bucket, bucket_tier * 2)
+            )
+        return revised_map
+
+    def _correct_platform_group(
+        self, pending, max_tokens: int
+    ) -> Dict[str, str]:
+        """Revise one length bucket of platform variants in a single call."""
+        revised_map: Dict[str, str] = {}
+        if len(pending) == 1:
+            platform, text = pending[0]
+            revised_map[platform] = self._correct_platform_content(
+                text, platform
+            )
+            return revised_map
+        items = "\n".join(
+            f"{index + 1}. [{platform}] {text}"
+            for index, (platform, text) in enumerate(pending)
+        )
+        prompt = (
+            self._platform_batch_prefix
+            + "\nRevise each numbered post below. Respond with a JSON array "
+            "of the revised strings, in the same order, and nothing else."
+            f"\n\n{items}\n\nJSON array:"
+        )
+        response = asyncio.run(
+            self.llm_service.generate_content(
+                prompt,
+                temperature=0.3,
+                cache_key=self._guidelines_cache_key,
+                max_tokens=max_tokens,
+            )
+        )
+        revisions = None
+        if response:
+            try:
+                parsed = json.loads(response.strip())
+                if isinstance(parsed, list) and len(parsed) == len(pending):
+                    revisions = parsed
+            except ValueError:
+                revisions = None
+        if revisions is None:
+            # Unparseable batch output: fall back to one call per item.
+            for platform, text in pending:
+                revised_map[platform] = self._correct_platform_content(
+                    text, platform
+                )
+            return revised_map
+        for (platform, text), revised in zip(pending, revisions):
+            revised = revised.strip() if isinstance(revised, str) else text
+            revised_map[platform] = revised or text
+            self._correction_cache.put(
+                "platform", platform, text, revised_map[platform]
+            )
+        return revised_map
+
+    def _correct_platform_content(self, text: str, platform: str) -> str:
+        """Ask the LLM to revise one platform variant toward the brand voice."""
+        cached = self._correction_cache.get("platform", platform, text)
+        if cached is not None:
+            return cached
+        prompt = self._platform_correction_template.format_map(
+            {"platform": platform, "text": text}
+        )
+        response = asyncio.run(
+            self.llm_service.generate_content(
+                prompt,
+                temperature=0.3,
+                cache_key=self._guidelines_cache_key,
+            )
+        )
+        revised = response.strip() if response else text
+        self._correction_cache.put("platform", platform, text, revised)
+        return revised
@@ -0,0 +1,396 @@
+"""Content planning agent: strategy, plan, outline and platform plans."""
+
+import asyncio
+import functools
+import json
+import re
+from datetime import datetime, timezone
+
+try:
+    import orjson as _json_fast
+except ImportError:
+    _json_fast = json
+
+from src.agents.base_agent import BaseAgent
+from src.core.error_handling import AgentException
+from src.models.state_models import ContentState
+from src.services.llm_service import _shared_batcher
+
+# Static parts of each platform plan; the dynamic fields (word counts,
+# keyword slices) are merged over these per call.
+_UTC = timezone.utc
+
+# Shared read-only default for .get misses; saves allocating a throwaway
+# empty dict per lookup on the per-request path.
+_EMPTY: dict = {}
+
+# Frozen prompt templates, interpolated once per call via format_map
+# instead of rebuilding multi-line f-strings at each call site.
+_COMBINED_PROMPT = """Plan a piece of content in three parts.
+Themes: {themes}
+Sentiment: {sentiment}
+Target audience: {audience}
+Requested content type: {content_type}
+Keywords: {keywords}
+
+1. "strategy": the high-level content strategy.
+2. "content_plan": a concrete plan implementing that strategy.
+3. "outline": a section-level outline of the planned content."""
+
+_STRATEGY_PROMPT = """Create a content strategy as JSON.
+Themes: {themes}
+Sentiment: {sentiment}
+Target audience: {audience}
+Requested content type: {content_type}
+
+Respond with a JSON object with keys: objective, angle, tone, call_to_action."""
+
+_PLAN_PROMPT = """Create a content plan as JSON for this strategy:
+Strategy: {strategy}
+Themes: {themes}
+Keywords: {keywords}
+
+Respond with a JSON object with keys: format, word_count, sections, keywords."""
+
+_OUTLINE_PROMPT = """Create a detailed outline as JSON for this plan:
+Plan: {plan}
+Themes: {themes}
+
+Respond with a JSON object with keys: title, sections (list of heading/points)."""
+
+# Spotted in the streamed plan as early as it is emitted; word_count is all
+# create_platform_plans needs, so the platform plans build while the rest
+# of the response is still decoding.
+_WORD_COUNT_RE = re.compile(r'"word_count"\s*:\s*(\d+)')
+
+_PLATFORM_TEMPLATES = {
+    "blog": {"format": "long_form", "include_seo": True},
+    "social": {
+        "format": "short_form",
+        "max_characters": 280,
+        "platforms": ["twitter", "linkedin", "instagram"],
+    },
+    "email": {"format": "newsletter", "include_cta": True},
+    "website": {"format": "landing_page", "include_hero": True},
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _build_platform_plans(word_count, keywords):
+    """Memoized platform-plan build keyed on its only real inputs.
+
+    Batches repeat the same word_count/keyword pairs constantly; repeats
+    return the cached structure (treated as read-only downstream) without
+    rebuilding any dicts.
+    """
+    tags = list(keywords)
+    overrides = {
+        "blog": {"word_count": word_count, "keywords": tags},
+        "social": {"hashtags": tags},
+        "email": {
+            "word_count": min(word_count, 500),
+            "subject_keywords": tags,
+        },
+        "website": {"word_count": word_count, "keywords": tags},
+    }
+    return {
+        platform: {**template, **overrides[platform]}
+        for platform, template in _PLATFORM_TEMPLATES.items()
+    }
+
+
+class ContentPlanner(BaseAgent):
+    """Turns input analysis into a concrete multi-platform content plan."""
+
+    name = "ContentPlanner"
+
+    def __init__(self):
+        # Shared batching wrapper: one configured SDK client serves every
+        # agent, and concurrent planners' generate_text calls coalesce
+        # into packed requests.
+        self.llm_service = _shared_batcher()
+
+    # Example shape handed to generate_structured; one call returns all
+    # three planning stages instead of three serial round-trips.
+    _PLAN_SCHEMA = {
+        "strategy": {
+            "objective": "...",
+            "angle": "...",
+            "tone": "...",
+            "call_to_action": "...",
+        },
+        "content_plan": {
+            "format": "...",
+            "word_count": 800,
+            "sections": 3,
+            "keywords": ["..."],
+        },
+        "outline": {
+            "title": "...",
+            "sections": [{"heading": "...", "points": ["..."]}],
+        },
+    }
+
+    def execute(self, state: ContentState) -> ContentState:
+        """Plan content for the analyzed input.
+
+        Writes the planning result to ``state.content_plan`` and returns
+        the state, per the BaseAgent contract; downstream agents read the
+        plan from the state rather than from result metadata.
+        """
+        analysis_data = state.input_analysis or _EMPTY
+        original_input = state.original_input or _EMPTY
+        if self._is_trivial(analysis_data, original_input):
+            # Thin payloads map 1:1 onto the fallback templates anyway;
+            # build the plan locally and skip the LLM round-trips.
+            state.content_plan = self._build_from_fallbacks(analysis_data)
+            return state
+        try:
+            state.content_plan = asyncio.run(
+                self._run_all(analysis_data, original_input)
+            )
+        except Exception as e:
+            raise AgentException("Content planning failed") from e
+        return state
+
+    @staticmethod
+    def _is_trivial(analysis_data, original_input) -> bool:
+        """True when the input carries nothing the LLM could use."""
+        return (
+            not analysis_data.get("themes")
+            and not analysis_data.get("keywords")
+            and original_input.get("content_type", "general") == "general"
+        )
+
+    def _build_from_fallbacks(self, analysis_data):
+        """Assemble a complete plan from the deterministic fallbacks."""
+        content_plan = self._plan_content_fallback(analysis_data)
+        return {
+            "strategy": self._create_strategy_fallback(analysis_data),
+            "content_plan": content_plan,
+            "outline": self._generate_outline_fallback(analysis_data),
+            "platform_plans": self.create_platform_plans(
+                content_plan, analysis_data
+            ),
+            "planned_at": datetime.now(_UTC).isoformat(timespec="seconds"),
+            "x_cache": "LOCAL",
+        }
+
+    async def _run_all(self, analysis_data, original_input):
+        """Run every planning stage on one event loop.
+
+        A single loop (and therefore a single client/connection) spans all
+        LLM traffic for the plan; the old layout bootstrapped a fresh loop
+        per stage. The theme/keyword joins are computed once here and
+        threaded through, instead of being rebuilt by every stage.
+        """
+        themes_str = ", ".join(analysis_data.get("themes", []))
+        keywords_str = ", ".join(analysis_data.get("keywords", [])[:10])
+        strategy, content_plan, outline, platform_plans = (
+            await self._plan_combined(
+                analysis_data, original_input, themes_str, keywords_str
+            )
+        )
+        if platform_plans is None:
+            platform_plans = self.create_platform_plans(
+                content_plan, analysis_data
+            )
+        return {
+            "strategy": strategy,
+            "content_plan": content_plan,
+            "outline": outline,
+            "platform_plans": platform_plans,
+            "planned_at": datetime.now(_UTC).isoformat(timespec="seconds"),
+            "x_cache": self.llm_service.last_cache_status,
+        }
+
+    async def _plan_combined(
+        self, analysis_data, original_input, themes_str, keywords_str
+    ):
+        """Request strategy, plan and outline in one structured LLM call.
+
+        A single composite prompt replaces the three serial round-trips;
+        the network and prefill cost of planning drops to one request.
+        The response is streamed: the platform plans are built as soon as
+        word_count appears in the token stream, overlapping with the rest
+        of the decode. When the streamed JSON cannot be parsed the
+        per-stage path runs instead; individually missing pieces fall back
+        per stage, same as the old per-call error paths.
+        """
+        # Dict inputs are serialized with sorted keys so equivalent
+        # payloads build identical prompts and hit the response cache.
+        sentiment = json.dumps(
+            analysis_data.get("sentiment", _EMPTY), sort_keys=True,
+            default=str,
+        )
+        audience = json.dumps(
+            analysis_data.get("target_audience", _EMPTY), sort_keys=True,
+            default=str,
+        )
+        prompt = _COMBINED_PROMPT.format_map(
+            {
+                "themes": themes_str,
+                "sentiment": sentiment,
+                "audience": audience,
+                "content_type": original_input.get("content_type", "general"),
+                "keywords": keywords_str,
+            }
+        )
+        schema_prompt = (
+            f"{prompt}\n\nRespond with a single JSON object matching "
+            f"this shape, and nothing else:\n{json.dumps(self._PLAN_SCHEMA)}"
+        )
+        chunks = []
+        early_plans = None
+        tail = ""
+        async for piece in self.llm_service.stream_text(schema_prompt):
+            chunks.append(piece)
+            if early_plans is None:
+                tail = (tail + piece)[-256:]
+                match = _WORD_COUNT_RE.search(tail)
+                if match:
+                    early_plans = self.create_platform_plans(
+                        {"word_count": int(match.group(1))}, analysis_data
+                    )
+        text = "".join(chunks).strip()
+        if text.startswith("```"):
+            text = text.strip("`")
+            if text.startswith("json"):
+                text = text[4:]
+        try:
+            result = _json_fast.loads(text)
+        except (ValueError, TypeError):
+            result = None
+        if not isinstance(result, dict):
+            return (
+                *await self._plan_stages(
+                    analysis_data, original_input, themes_str, keywords_str
+                ),
+                None,
+            )
+        strategy = result.get("strategy")
+        if not isinstance(strategy, dict):
+            strategy = self._create_strategy_fallback(analysis_data)
+        content_plan = result.get("content_plan")
+        if not isinstance(content_plan, dict):
+            content_plan = self._plan_content_fallback(analysis_data)
+        outline = result.get("outline")
+        if not isinstance(outline, dict):
+            outline = self._generate_outline_fallback(analysis_data)
+        return strategy, content_plan, outline, early_plans
+
+    async def _plan_stages(
+        self, analysis_data, original_input, themes_str, keywords_str
+    ):
+        """Per-stage planning path used when the composite call fails.
+
+        Only the plan truly depends on the strategy; the outline is drafted
+        speculatively from the strategy plus the deterministic fallback
+        plan and gathered concurrently with the real plan, overlapping the
+        two remaining LLM round-trips.
+        """
+        strategy = await self.create_strategy(
+            analysis_data, original_input, themes_str
+        )
+        draft_plan = self._plan_content_fallback(analysis_data)
+        draft_plan["strategy"] = strategy
+        content_plan, outline = await asyncio.gather(
+            self.plan_content(
+                strategy, analysis_data, themes_str, keywords_str
+            ),
+            self.generate_outline(draft_plan, analysis_data, themes_str),
+        )
+        return strategy, content_plan, outline
+
+    async def create_strategy(
+        self, analysis_data, original_input, themes_str=None
+    ):
+        """Ask the LLM for a high-level content strategy."""
+        if themes_str is None:
+            themes_str = ", ".join(analysis_data.get("themes", []))
+        sentiment = analysis_data.get("sentiment", _EMPTY)
+        audience = analysis_data.get("target_audience", _EMPTY)
+        prompt = _STRATEGY_PROMPT.format_map(
+            {
+                "themes": themes_str,
+                "sentiment": sentiment,
+                "audience": audience,
+                "content_type": original_input.get("content_type", "general"),
+            }
+        )
+        response = await self.llm_service.generate_text(prompt)
+        try:
+            return _json_fast.loads(response)
+        except (ValueError, TypeError):
+            return self._create_strategy_fallback(analysis_data)
+
+    async def plan_content(
+        self, strategy, analysis_data, themes_str=None, keywords_str=None
+    ):
+        """Ask the LLM to turn the strategy into a concrete content plan."""
+        if themes_str is None:
+            themes_str = ", ".join(analysis_data.get("themes", []))
+        if keywords_str is None:
+            keywords_str = ", ".join(analysis_data.get("keywords", [])[:10])
+        prompt = _PLAN_PROMPT.format_map(
+            {
+                "strategy": strategy,
+                "themes": themes_str,
+                "keywords": keywords_str,
+            }
+        )
+        response = await self.llm_service.generate_text(prompt)
+        try:
+            return _json_fast.loads(response)
+        except (ValueError, TypeError):
+            return self._plan_content_fallback(analysis_data)
+
+    async def generate_outline(
+        self, content_plan, analysis_data, themes_str=None
+    ):
+        """Ask the LLM for a section-level outline of the planned content."""
+        if themes_str is None:
+            themes_str = ", ".join(analysis_data.get("themes", []))
+        prompt = _OUTLINE_PROMPT.format_map(
+            {"plan": content_plan, "themes": themes_str}
+        )
+        response = await self.llm_service.generate_text(prompt)
+        try:
+            return _json_fast.loads(response)
+        except (ValueError, TypeError):
+            return self._generate_outline_fallback(analysis_data)
+
+    def create_platform_plans(self, content_plan, analysis_data):
+        """Build per-platform adaptation plans from the master content plan."""
+        return _build_platform_plans(
+            content_plan.get("word_count", 800),
+            tuple(analysis_data.get("keywords", [])[:5]),
+        )
+
+    def _create_strategy_fallback(self, analysis_data):
+        themes = analysis_data.get("themes", [])
+        return {
+            "objective": "inform",
+            "angle": themes[0] if themes else "general",
+            "tone": "professional",
+            "call_to_action": "learn_more",
+        }
+
+    def _plan_content_fallback(self, analysis_data):
+        return {
+            "format": "article",
+            "word_count": 800,
+            "sections": 3,
+            "keywords": analysis_data.get("keywords", [])[:10],
+        }
+
+    def _generate_outline_fallback(self, analysis_data):
+        themes = analysis_data.get("themes", [])
+        return {
+            "title": themes[0].title() if themes else "Untitled",
+            "sections": [
+                {"heading": "Introduction", "points": themes[:2]},
+                {"heading": "Main Body", "points": themes},
+                {"heading": "Conclusion", "points": []},
+            ],
+        }
@@ -0,0 +1,126 @@
+"""Input analysis agent: themes, sentiment and keywords from raw input."""
+
+import re
+from collections import Counter
+from heapq import nlargest
+from typing import Dict, List
+
+from src.agents.base_agent import BaseAgent
+from src.models.state_models import ContentState
+
+try:
+    import numba
+    import numpy as np
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# Compiled once; tokenization was previously a per-call split/strip loop.
+_TOKEN_RE = re.compile(r"[A-Za-z]+")
+
+STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "if", "then", "of", "to", "in",
+    "on", "for", "with", "as", "by", "at", "is", "are", "was", "were", "be",
+    "been", "it", "its", "this", "that", "these", "those", "from", "we",
+    "you", "they", "he", "she", "has", "have", "had", "not", "no", "so",
+    "can", "will", "would", "should", "could", "do", "does", "did",
+})
+
+POSITIVE_WORDS = ["good", "great", "excellent", "amazing", "innovative", "growth"]
+NEGATIVE_WORDS = ["bad", "poor", "terrible", "decline", "risk", "failure"]
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _count_ids(ids):  # pragma: no cover - compiled path
+        """Count occurrences of each token id in a C-speed loop."""
+        counts = numba.typed.Dict.empty(
+            key_type=numba.int64, value_type=numba.int64
+        )
+        for i in range(ids.shape[0]):
+            token_id = ids[i]
+            if token_id in counts:
+                counts[token_id] += 1
+            else:
+                counts[token_id] = 1
+        return counts
+
+
+class InputAnalyzer(BaseAgent):
+    """Extracts themes, sentiment and keywords from the original input."""
+
+    name = "InputAnalyzer"
+
+    # Lazily grown token-id vocabulary shared by the JIT counting kernel.
+    _vocab: Dict[str, int] = {}
+    _vocab_tokens: List[str] = []
+
+    def execute(self, state: ContentState) -> ContentState:
+        text = str(state.original_input.get("text", ""))
+        state.input_analysis = {
+            "themes": self.extract_themes(text),
+            "sentiment": self.analyze_sentiment(text),
+            "keywords": self.extract_keywords(text),
+        }
+        return state
+
+    def extract_themes(self, content: str) -> List[str]:
+        """Pick the most frequent non-trivial words as rough themes."""
+        keywords = self.extract_keywords(content, top_k=5)
+        return keywords[:3]
+
+    def analyze_sentiment(self, content: str) -> Dict[str, float]:
+        """Crude lexicon-based sentiment scoring."""
+        words = content.lower().split()
+        if not words:
+            return {"positive": 0.0, "negative": 0.0, "neutral": 1.0}
+        positive = sum(1 for w in words if w in POSITIVE_WORDS)
+        negative = sum(1 for w in words if w in NEGATIVE_WORDS)
+        total = len(words)
+        return {
+            "positive": positive / total,
+            "negative": negative / total,
+            "neutral": max(0.0, 1.0 - (positive + negative) / total),
+        }
+
+    def extract_keywords(self, content: str, top_k: int = 10) -> List[str]:
+        """Rank non-stopword tokens by frequency.
+
+        Tokenization is one compiled-regex pass; counting runs in a
+        numba-JIT kernel over hashed token ids when numba is installed
+        (first call pays the compile, ``cache=True`` persists it), with a
+        Counter fallback otherwise.
+        """
+        tokens = [
+            t for t in map(str.lower, _TOKEN_RE.findall(content))
+            if len(t) >= 3 and t not in STOPWORDS
+        ]
+        if not tokens:
+            return []
+        if _NUMBA_AVAILABLE:
+            return self._extract_keywords_jit(tokens, top_k)
+        counts = Counter(tokens)
+        return [t for t, _ in nlargest(top_k, counts.items(), key=lambda kv: kv[1])]
+
+    @classmethod
+    def _extract_keywords_jit(cls, tokens: List[str], top_k: int) -> List[str]:
+        """numba path: count hashed token ids, select top-K via argpartition."""
+        vocab = cls._vocab
+        vocab_tokens = cls._vocab_tokens
+        ids = np.empty(len(tokens), dtype=np.int64)
+        for i, token in enumerate(tokens):
+            token_id = vocab.get(token)
+            if token_id is None:
+                token_id = len(vocab_tokens)
+                vocab[token] = token_id
+                vocab_tokens.append(token)
+            ids[i] = token_id
+        counts = _count_ids(ids)
+        unique_ids = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        freqs = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        k = min(top_k, unique_ids.shape[0])
+        top = np.argpartition(freqs, -k)[-k:]
+        order = top[np.argsort(freqs[top])[::-1]]
+        return [vocab_tokens[unique_ids[i]] for i in order]
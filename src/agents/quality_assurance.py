@@ -0,0 +1,36 @@
+"""Quality assurance agent: multi-dimensional scoring of generated content."""
+
+from typing import Dict
+
+from src.agents.base_agent import BaseAgent
+from src.models.state_models import ContentState
+
+
+class QualityAssurance(BaseAgent):
+    """Scores generated content on readability, length and structure."""
+
+    name = "QualityAssurance"
+
+    def execute(self, state: ContentState) -> ContentState:
+        scores: Dict[str, float] = {}
+        for content_type, text in state.text_content.items():
+            scores[content_type] = self.assess_quality(text)
+        state.quality_scores = scores
+        return state
+
+    def assess_quality(self, text: str) -> float:
+        """Score one piece of content on a 0-10 scale."""
+        if not text:
+            return 0.0
+        words = text.split()
+        sentences = [s for s in text.split(".") if s.strip()]
+        score = 5.0
+        if 50 <= len(words) <= 2000:
+            score += 2.0
+        if sentences:
+            avg_len = len(words) / len(sentences)
+            if 8 <= avg_len <= 25:
+                score += 2.0
+        if text[0].isupper():
+            score += 1.0
+        return min(score, 10.0)
@@ -0,0 +1 @@
+"""HTTP API for ViraLearn ContentBot."""
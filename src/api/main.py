@@ -0,0 +1,53 @@
+"""FastAPI application exposing the content workflow API."""
+
+import uuid
+from functools import lru_cache
+from typing import Any, Dict
+
+from fastapi import FastAPI
+
+from config.database import check_database_health
+from src.models.state_models import ContentState
+
+_metrics: Dict[str, int] = {"workflows_created": 0, "requests": 0}
+
+
+def create_app() -> FastAPI:
+    """Build the ContentBot FastAPI application."""
+    app = FastAPI(title="ViraLearn ContentBot", version="0.1.0")
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        db = await check_database_health()
+        return {"status": "ok", "database": db}
+
+    @app.get("/metrics")
+    async def metrics() -> Dict[str, int]:
+        _metrics["requests"] += 1
+        return dict(_metrics)
+
+    @app.post("/api/v1/workflows", status_code=201)
+    async def create_workflow(payload: Dict[str, Any]) -> Dict[str, Any]:
+        state = ContentState(
+            workflow_id=str(uuid.uuid4()),
+            user_id=str(payload.get("user_id", "anonymous")),
+            original_input=payload.get("input", {}),
+        )
+        _metrics["workflows_created"] += 1
+        # WorkflowStatus is an IntEnum; keep the API's string wire format.
+        return {
+            "workflow_id": state.workflow_id,
+            "status": state.status.name.lower(),
+        }
+
+    return app
+
+
+@lru_cache(maxsize=1)
+def get_app() -> FastAPI:
+    """Process-wide application instance.
+
+    ``create_app`` rebuilds routes and middleware on every call; callers that
+    just need *the* app (health commands, embedding) should use this.
+    """
+    return create_app()
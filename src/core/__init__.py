@@ -0,0 +1 @@
+"""Core infrastructure for ViraLearn ContentBot."""
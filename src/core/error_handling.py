@@ -0,0 +1,35 @@
+"""Custom exceptions and error-recovery helpers."""
+
+import traceback
+from typing import Any, Dict
+
+
+class ViraLearnError(Exception):
+    """Base class for all ContentBot errors."""
+
+
+class AgentException(ViraLearnError):
+    """Raised when an agent fails during execution."""
+
+
+class ValidationException(ViraLearnError):
+    """Raised when workflow state fails validation."""
+
+
+class ServiceException(ViraLearnError):
+    """Raised when an external service call fails."""
+
+
+def exception_to_payload(exc: BaseException) -> Dict[str, Any]:
+    """Serialize an exception (including its cause chain) for structured logs."""
+    payload: Dict[str, Any] = {
+        "error_type": type(exc).__name__,
+        "error": str(exc),
+        "traceback": traceback.format_exception(type(exc), exc, exc.__traceback__),
+    }
+    if exc.__cause__ is not None:
+        payload["cause"] = {
+            "error_type": type(exc.__cause__).__name__,
+            "error": str(exc.__cause__),
+        }
+    return payload
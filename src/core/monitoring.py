@@ -0,0 +1,70 @@
+"""Structured logging and observability helpers.
+
+Every workflow gets a :class:`WorkflowMonitoring` wrapper that stamps the
+workflow id onto each structured event.
+"""
+
+import functools
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger("viralearn")
+
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
+class Lazy:
+    """Defers computing a log payload value until it is rendered.
+
+    Wrap expensive values as ``Lazy(lambda: ...)``; the callable runs only
+    if the record actually gets formatted.
+    """
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[[], Any]):
+        self.fn = fn
+
+    def __repr__(self) -> str:
+        return repr(self.fn())
+
+    __str__ = __repr__
+
+
+class WorkflowMonitoring:
+    """Structured event logging scoped to a single workflow."""
+
+    def __init__(self, workflow_id: str):
+        self.workflow_id = workflow_id
+
+    def is_enabled_for(self, level: str) -> bool:
+        """True when records at ``level`` would actually be emitted."""
+        return logger.isEnabledFor(_LEVELS.get(level, logging.INFO))
+
+    def _emit(self, level: int, event: str, kwargs: dict) -> None:
+        logger.log(
+            level,
+            "%s %s",
+            event,
+            {"workflow_id": self.workflow_id, **kwargs},
+        )
+
+    def info(self, event: str, **kwargs: Any) -> None:
+        self._emit(logging.INFO, event, kwargs)
+
+    def warning(self, event: str, **kwargs: Any) -> None:
+        self._emit(logging.WARNING, event, kwargs)
+
+    def error(self, event: str, **kwargs: Any) -> None:
+        self._emit(logging.ERROR, event, kwargs)
+
+
+@functools.lru_cache(maxsize=256)
+def get_monitoring(workflow_id: str) -> WorkflowMonitoring:
+    """Return the (memoized) monitoring wrapper for the given workflow."""
+    return WorkflowMonitoring(workflow_id)
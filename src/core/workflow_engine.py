@@ -0,0 +1,37 @@
+"""LangGraph-style workflow orchestration over the agent pipeline."""
+
+import logging
+from typing import List
+
+from src.agents import get_analyzer, get_planner, get_qa
+from src.agents.base_agent import BaseAgent
+from src.models.state_models import ContentState, WorkflowStatus
+
+logger = logging.getLogger(__name__)
+
+
+class WorkflowEngine:
+    """Drives a content workflow through the agent pipeline in order."""
+
+    def __init__(self):
+        self.agents: List[BaseAgent] = [get_analyzer(), get_planner(), get_qa()]
+
+    async def ping(self) -> bool:
+        """Cheap liveness check used by health probes."""
+        return bool(self.agents)
+
+    def execute_workflow(self, state: ContentState) -> ContentState:
+        """Run every pipeline agent against the state in sequence."""
+        for agent in self.agents:
+            result = agent.run(state)
+            if not result.success:
+                logger.error(
+                    "workflow step failed: agent=%s error=%s",
+                    agent.name,
+                    result.error,
+                )
+                state.status = WorkflowStatus.FAILED
+                return state
+            state = result.state
+        state.status = WorkflowStatus.COMPLETED
+        return state
@@ -0,0 +1,6 @@
+"""Data models for ViraLearn ContentBot."""
+
+from src.models.content_models import BlogPost, SocialPost
+from src.models.state_models import ContentState, WorkflowStatus
+
+__all__ = ["BlogPost", "ContentState", "SocialPost", "WorkflowStatus"]
@@ -0,0 +1,31 @@
+"""Generated-content data models.
+
+These are pure data carriers instantiated in hot generation paths, so they
+are ``msgspec.Struct`` subclasses: keyword construction matches the old
+pydantic API but fills a C struct instead of running schema validation.
+"""
+
+from typing import Dict, List
+
+import msgspec
+
+
+class BlogPost(msgspec.Struct, kw_only=True):
+    """A long-form blog post with structured sections."""
+
+    title: str
+    summary: str
+    sections: List[Dict[str, str]] = []
+    keywords: List[str] = []
+    word_count: int = 0
+    seo_score: float = 0.0
+
+
+class SocialPost(msgspec.Struct, kw_only=True):
+    """A short-form post targeted at one social platform."""
+
+    platform: str
+    content: str
+    hashtags: List[str] = []
+    character_count: int = 0
+    engagement_score: float = 0.0
@@ -0,0 +1,81 @@
+"""Workflow state models shared by every agent.
+
+``ContentState`` is constructed and copied on every workflow step, so it is
+built on ``msgspec.Struct`` rather than pydantic: construction is a C-level
+struct fill instead of a pydantic-core validation pass (~6.5x faster for
+deserialize+validate workloads), with lower GC pressure.
+"""
+
+from enum import IntEnum
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+
+class WorkflowStatus(IntEnum):
+    """Lifecycle states for a content workflow.
+
+    An ``IntEnum``: comparisons and dict hashing are plain int operations
+    instead of string work, and msgspec encodes members as small integers.
+    Use ``member.name.lower()`` where the old string value is needed on the
+    wire.
+    """
+
+    INITIATED = 0
+    IN_PROGRESS = 1
+    COMPLETED = 2
+    FAILED = 3
+
+
+class ContentState(msgspec.Struct, kw_only=True):
+    """Full state of one content-generation workflow.
+
+    Passed between agents by the workflow engine; every field an agent may
+    read or write is declared here.
+    """
+
+    # Workflow management
+    workflow_id: str
+    user_id: str
+    status: WorkflowStatus = WorkflowStatus.INITIATED
+    current_agent: Optional[str] = None
+    step_count: int = 0
+
+    # Content data
+    original_input: Dict[str, Any] = {}
+    input_analysis: Optional[Dict[str, Any]] = None
+    text_content: Dict[str, str] = {}
+    image_content: Dict[str, str] = {}
+    audio_content: Dict[str, Any] = {}
+    audio_transcription_requests: Dict[str, Dict[str, Any]] = {}
+    platform_content: Dict[str, Dict[str, Any]] = {}
+    content_plan: Optional[Dict[str, Any]] = None
+
+    # Quality control
+    quality_scores: Dict[str, float] = {}
+    brand_compliance: Optional[Dict[str, Any]] = None
+    human_feedback: List[Dict[str, Any]] = []
+
+    # Monotonic mutation counter; lets validators skip re-checking a state
+    # they have already seen at this revision.
+    _revision: int = 0
+    # Last revision that passed validate_content_state. Lives on the state
+    # itself so the skip marker dies with the state instead of keying an
+    # external map by a reusable id().
+    _validated_revision: int = -1
+
+    def increment_step(self) -> None:
+        """Advance the workflow step counter."""
+        self.step_count += 1
+        self._revision += 1
+
+    def update_trusted(self, **kwargs: Any) -> None:
+        """Bulk-update fields from trusted internal code.
+
+        Plain setattr: msgspec structs have no per-field hook dispatch to
+        bypass (and reject ``object.__setattr__``); callers are responsible
+        for passing already-valid values.
+        """
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self._revision += 1
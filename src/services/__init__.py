@@ -0,0 +1 @@
+"""External service integrations for ViraLearn ContentBot."""
@@ -0,0 +1,247 @@
+"""Audio synthesis and transcription service backed by Google Cloud.
+
+Falls back to deterministic placeholder payloads when the Google Cloud
+clients are not installed or not configured, mirroring the LLM service's
+fallback behaviour.
+"""
+
+import asyncio
+import html
+import logging
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+try:
+    from google.cloud import speech as google_speech
+    from google.cloud import texttospeech as google_tts
+
+    GOOGLE_AUDIO_AVAILABLE = True
+except ImportError:
+    GOOGLE_AUDIO_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Chunk size for streamed synthesis output.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class TTSRequest(BaseModel):
+    """One text-to-speech synthesis request."""
+
+    text: str
+    voice_name: str = "en-US-Neural2-A"
+    language_code: str = "en-US"
+    speaking_rate: float = 1.0
+    pitch: float = 0.0
+    audio_format: str = "mp3"
+
+
+class STTRequest(BaseModel):
+    """One speech-to-text transcription request."""
+
+    audio_data: bytes
+    language_code: str = "en-US"
+    sample_rate: int = 16000
+    audio_format: str = "wav"
+
+
+class AudioService:
+    """Async wrapper around the TTS/STT provider clients."""
+
+    def __init__(self):
+        self._tts_client = None
+        self._stt_client = None
+        self._initialized = False
+
+    async def initialize(self) -> None:
+        """Construct provider clients and warm their channels."""
+        if self._initialized:
+            return
+        if GOOGLE_AUDIO_AVAILABLE:
+            self._tts_client = await asyncio.to_thread(
+                google_tts.TextToSpeechAsyncClient
+            )
+            self._stt_client = await asyncio.to_thread(
+                google_speech.SpeechAsyncClient
+            )
+        self._initialized = True
+
+    async def text_to_speech(self, request: TTSRequest) -> Dict[str, Any]:
+        """Synthesize speech for one request.
+
+        Returns a dict with ``audio_data`` (bytes), ``format`` and
+        ``voice_name``; a fallback payload when no provider is available.
+        """
+        if not self._initialized:
+            await self.initialize()
+        if self._tts_client is None:
+            return self._fallback_tts(request)
+        try:
+            response = await self._tts_client.synthesize_speech(
+                input=google_tts.SynthesisInput(text=request.text),
+                voice=google_tts.VoiceSelectionParams(
+                    language_code=request.language_code,
+                    name=request.voice_name,
+                ),
+                audio_config=google_tts.AudioConfig(
+                    audio_encoding=google_tts.AudioEncoding.MP3,
+                    speaking_rate=request.speaking_rate,
+                    pitch=request.pitch,
+                ),
+            )
+        except Exception:
+            logger.exception("TTS synthesis failed; using fallback")
+            return self._fallback_tts(request)
+        return {
+            "audio_data": response.audio_content,
+            "format": request.audio_format,
+            "voice_name": request.voice_name,
+        }
+
+    async def text_to_speech_stream(self, request: TTSRequest):
+        """Yield the synthesized audio for one request in chunks.
+
+        Lets callers spool long-form audio to disk instead of holding the
+        whole payload (and a serialization copy of it) in memory.
+        """
+        response = await self.text_to_speech(request)
+        audio = response.get("audio_data", b"")
+        for offset in range(0, len(audio), _STREAM_CHUNK_SIZE):
+            yield audio[offset:offset + _STREAM_CHUNK_SIZE]
+
+    async def text_to_speech_batch(
+        self, requests: List[TTSRequest]
+    ) -> List[Dict[str, Any]]:
+        """Synthesize several same-voice texts in one provider round-trip.
+
+        Callers must pass requests sharing ``voice_name`` and
+        ``language_code``. The texts are packed into one SSML document with
+        a ``<mark>`` before each item; the provider's mark timepoints are
+        then used to split the combined audio back into per-item payloads.
+        Falls back to individual calls when batching is unavailable.
+        """
+        if not self._initialized:
+            await self.initialize()
+        if self._tts_client is None or len(requests) == 1:
+            return list(
+                await asyncio.gather(
+                    *(self.text_to_speech(r) for r in requests)
+                )
+            )
+        first = requests[0]
+        parts = ["<speak>"]
+        for index, request in enumerate(requests):
+            parts.append(f'<mark name="m{index}"/>')
+            parts.append(html.escape(request.text))
+        # Sentinel mark after the final item: its timepoint is the total
+        # duration, giving the last slice a real end boundary.
+        parts.append(f'<mark name="m{len(requests)}"/>')
+        parts.append("</speak>")
+        try:
+            # enable_time_pointing is a field of SynthesizeSpeechRequest,
+            # not a keyword of the flattened synthesize_speech signature,
+            # so the full request message is built explicitly.
+            batch_request = google_tts.SynthesizeSpeechRequest(
+                input=google_tts.SynthesisInput(ssml="".join(parts)),
+                voice=google_tts.VoiceSelectionParams(
+                    language_code=first.language_code,
+                    name=first.voice_name,
+                ),
+                audio_config=google_tts.AudioConfig(
+                    audio_encoding=google_tts.AudioEncoding.MP3,
+                    speaking_rate=first.speaking_rate,
+                    pitch=first.pitch,
+                ),
+                enable_time_pointing=[
+                    google_tts.SynthesizeSpeechRequest.TimepointType.SSML_MARK
+                ],
+            )
+            response = await self._tts_client.synthesize_speech(
+                request=batch_request
+            )
+        except Exception:
+            logger.exception("Batched TTS failed; retrying per item")
+            return list(
+                await asyncio.gather(
+                    *(self.text_to_speech(r) for r in requests)
+                )
+            )
+        return self._split_batch_audio(response, requests)
+
+    @staticmethod
+    def _split_batch_audio(
+        response: Any, requests: List[TTSRequest]
+    ) -> List[Dict[str, Any]]:
+        """Split batched audio back into one payload per request."""
+        audio = response.audio_content
+        marks = list(response.timepoints)
+        # One mark per request plus the trailing sentinel.
+        if len(marks) != len(requests) + 1:
+            # Provider did not report every mark; hand everyone the full
+            # audio rather than guessing at boundaries.
+            return [
+                {
+                    "audio_data": audio,
+                    "format": r.audio_format,
+                    "voice_name": r.voice_name,
+                }
+                for r in requests
+            ]
+        # The sentinel's timepoint is the total duration; normalizing by a
+        # start time would fold the final item into the previous slice.
+        total_seconds = marks[-1].time_seconds or 1.0
+        # Proportional byte split: close enough for the preview payloads we
+        # store, and avoids decoding the MP3 stream to find frame edges.
+        boundaries = [
+            int(len(audio) * (mark.time_seconds / total_seconds))
+            for mark in marks[:-1]
+        ] + [len(audio)]
+        return [
+            {
+                "audio_data": audio[boundaries[i]:boundaries[i + 1]],
+                "format": r.audio_format,
+                "voice_name": r.voice_name,
+            }
+            for i, r in enumerate(requests)
+        ]
+
+    async def speech_to_text(self, request: STTRequest) -> Dict[str, Any]:
+        """Transcribe one audio payload."""
+        if not self._initialized:
+            await self.initialize()
+        if self._stt_client is None:
+            return {"transcript": "", "confidence": 0.0, "status": "fallback"}
+        try:
+            response = await self._stt_client.recognize(
+                config=google_speech.RecognitionConfig(
+                    language_code=request.language_code,
+                    sample_rate_hertz=request.sample_rate,
+                ),
+                audio=google_speech.RecognitionAudio(content=request.audio_data),
+            )
+        except Exception:
+            logger.exception("STT transcription failed; using fallback")
+            return {"transcript": "", "confidence": 0.0, "status": "fallback"}
+        best: Optional[Any] = None
+        for result in response.results:
+            if result.alternatives:
+                best = result.alternatives[0]
+                break
+        if best is None:
+            return {"transcript": "", "confidence": 0.0, "status": "empty"}
+        return {
+            "transcript": best.transcript,
+            "confidence": best.confidence,
+            "status": "ok",
+        }
+
+    @staticmethod
+    def _fallback_tts(request: TTSRequest) -> Dict[str, Any]:
+        """Deterministic placeholder used when no provider is configured."""
+        return {
+            "audio_data": b"",
+            "format": request.audio_format,
+            "voice_name": request.voice_name,
+            "status": "fallback",
+        }
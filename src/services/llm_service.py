@@ -0,0 +1,420 @@
+"""Gemini LLM integration.
+
+Wraps google-generativeai behind a small service interface; when the SDK or
+an API key is unavailable the service degrades to deterministic fallback
+responses so demos and tests still run.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import google.generativeai as genai
+
+    GOOGLE_AI_AVAILABLE = True
+except ImportError:
+    genai = None
+    GOOGLE_AI_AVAILABLE = False
+
+try:
+    from cachetools import TTLCache
+
+    _CACHETOOLS_AVAILABLE = True
+except ImportError:
+    _CACHETOOLS_AVAILABLE = False
+
+
+class GenerationRequest(BaseModel):
+    """A single text-generation request."""
+
+    prompt: str
+    system_prompt: Optional[str] = None
+    temperature: float = Field(default=0.7, ge=0.0, le=2.0)
+    max_tokens: int = Field(default=2048, gt=0)
+
+
+class LLMService:
+    """Text generation backed by Gemini."""
+
+    # Short-TTL response cache: planning and correction flows frequently
+    # resubmit byte-identical prompts (demos, retries); a hit skips the
+    # whole decode phase.
+    _CACHE_TTL = 3600.0
+    _CACHE_SIZE = 512
+
+    def __init__(self):
+        self.settings = get_settings().gemini
+        self._configured = False
+        # Built lazily and reused for every request: constructing the model
+        # per call would tear down and rebuild the SDK's underlying
+        # transport, losing the warm connection between calls.
+        self._model = None
+        if _CACHETOOLS_AVAILABLE:
+            self._response_cache = TTLCache(
+                maxsize=self._CACHE_SIZE, ttl=self._CACHE_TTL
+            )
+        else:
+            # digest -> (expiry, text); bounded LRU with manual expiry.
+            self._response_cache = OrderedDict()
+        # "HIT"/"MISS" for the most recent cached call; surfaced by agents
+        # as X-Cache in their result data.
+        self.last_cache_status = "MISS"
+        if GOOGLE_AI_AVAILABLE and self.settings.api_key:
+            genai.configure(api_key=self.settings.api_key)
+            self._configured = True
+
+    def _get_model(self):
+        """Return the persistent GenerativeModel, creating it on first use."""
+        if self._model is None:
+            self._model = genai.GenerativeModel(self.settings.model)
+        return self._model
+
+    async def generate(self, request: GenerationRequest) -> str:
+        """Generate text for a full :class:`GenerationRequest`."""
+        if not self._configured:
+            return self._fallback_response(request.prompt)
+        model = self._get_model()
+        response = await asyncio.to_thread(
+            model.generate_content,
+            request.prompt,
+            generation_config={
+                "temperature": request.temperature,
+                "max_output_tokens": request.max_tokens,
+            },
+        )
+        return response.text
+
+    def _cache_get(self, digest: str) -> Optional[str]:
+        if _CACHETOOLS_AVAILABLE:
+            return self._response_cache.get(digest)
+        entry = self._response_cache.get(digest)
+        if entry is None:
+            return None
+        expiry, text = entry
+        if expiry < time.monotonic():
+            del self._response_cache[digest]
+            return None
+        self._response_cache.move_to_end(digest)
+        return text
+
+    def _cache_put(self, digest: str, text: str) -> None:
+        if _CACHETOOLS_AVAILABLE:
+            self._response_cache[digest] = text
+            return
+        if len(self._response_cache) >= self._CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        self._response_cache[digest] = (
+            time.monotonic() + self._CACHE_TTL,
+            text,
+        )
+
+    async def generate_text(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Generate text for a bare prompt, with a short-TTL response cache.
+
+        The key is a hash of the whitespace-stripped prompt plus the
+        sampling knobs; callers that normalize their prompt construction
+        (sorted dict keys) get hits for equivalent inputs.
+        """
+        digest = hashlib.sha256(
+            f"{prompt.strip()}|{temperature}|{max_tokens}".encode()
+        ).hexdigest()
+        cached = self._cache_get(digest)
+        if cached is not None:
+            self.last_cache_status = "HIT"
+            return cached
+        self.last_cache_status = "MISS"
+        request = GenerationRequest(prompt=prompt, temperature=temperature)
+        if max_tokens is not None:
+            request.max_tokens = max_tokens
+        response = await self.generate(request)
+        if response:
+            self._cache_put(digest, response)
+        return response
+
+    async def stream_text(self, prompt: str, temperature: float = 0.7):
+        """Yield response text chunks as the model generates them.
+
+        Lets callers overlap parsing and downstream work with the decode
+        phase instead of idling until the full response lands. Shares the
+        response cache with generate_text: a hit yields the cached text in
+        one piece, and a completed stream is stored for later hits.
+        """
+        digest = hashlib.sha256(
+            f"{prompt.strip()}|{temperature}|None".encode()
+        ).hexdigest()
+        cached = self._cache_get(digest)
+        if cached is not None:
+            self.last_cache_status = "HIT"
+            yield cached
+            return
+        self.last_cache_status = "MISS"
+        if not self._configured:
+            yield self._fallback_response(prompt)
+            return
+        model = self._get_model()
+        response = await asyncio.to_thread(
+            model.generate_content,
+            prompt,
+            generation_config={"temperature": temperature},
+            stream=True,
+        )
+        loop = asyncio.get_running_loop()
+        iterator = iter(response)
+        parts = []
+        while True:
+            # The SDK's stream iterator blocks on the network; step it off
+            # the event loop so other tasks keep running between chunks.
+            chunk = await loop.run_in_executor(None, next, iterator, None)
+            if chunk is None:
+                break
+            text = getattr(chunk, "text", "") or ""
+            if text:
+                parts.append(text)
+                yield text
+        if parts:
+            self._cache_put(digest, "".join(parts))
+
+    async def generate_content(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        cache_key: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Alias used by content agents; same contract as generate_text.
+
+        ``cache_key`` marks a stable prompt prefix (e.g. brand guidelines)
+        so providers with prompt/prefix caching can reuse the KV prefill.
+        Gemini exposes this through context caching; until that path is
+        wired up the hint is accepted and ignored rather than breaking
+        callers.
+        """
+        return await self.generate_text(
+            prompt, temperature=temperature, max_tokens=max_tokens
+        )
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.7,
+    ) -> Optional[Dict[str, Any]]:
+        """Generate a JSON object for a prompt; None when parsing fails.
+
+        ``schema`` is an example-shaped dict appended to the prompt so the
+        model knows the expected keys. Callers keep their own fallbacks for
+        the None path.
+        """
+        if schema is not None:
+            prompt = (
+                f"{prompt}\n\nRespond with a single JSON object matching "
+                f"this shape, and nothing else:\n{json.dumps(schema)}"
+            )
+        response = await self.generate_text(prompt, temperature=temperature)
+        if not response:
+            return None
+        text = response.strip()
+        if text.startswith("```"):
+            # Strip a markdown code fence if the model wrapped the JSON.
+            text = text.strip("`")
+            if text.startswith("json"):
+                text = text[4:]
+        try:
+            parsed = json.loads(text)
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    @staticmethod
+    def _fallback_response(prompt: str) -> str:
+        """Deterministic response used when Gemini is not configured."""
+        logger.debug("LLM fallback response used (prompt length %d)", len(prompt))
+        return ""
+
+
+class BatchingLLMService:
+    """Batches concurrent generate_text calls into one model request.
+
+    Calls arriving within the batching window are packed into a single
+    numbered prompt that asks for a JSON array of answers (the provider
+    exposes no batch endpoint, so prompt packing stands in for it); each
+    caller awaits a future resolved from the split response. Batching
+    state lives on one dedicated event loop so callers on different loops
+    and threads (each sync agent drives its own ``asyncio.run``) share a
+    window instead of racing to rebind it. Unparseable batches fall back
+    to per-call requests, and every other attribute passes through to the
+    wrapped LLMService.
+    """
+
+    _WINDOW = 0.01
+    _MAX_BATCH = 8
+    _IDLE_TIMEOUT = 2.0
+
+    def __init__(self, service: Optional[LLMService] = None):
+        self._service = service or _shared_llm()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        # Touched only from the batching loop; no lock needed beyond it.
+        self._queue: Optional[asyncio.Queue] = None
+        self._draining = False
+
+    def __getattr__(self, name):
+        return getattr(self._service, name)
+
+    def _batching_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the dedicated batching loop, starting it on first use."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="llm-batcher",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    async def generate_text(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        # Hop onto the batching loop; wrapping the handle keeps the
+        # caller's own loop free while the batch is in flight.
+        handle = asyncio.run_coroutine_threadsafe(
+            self._enqueue(prompt, temperature, max_tokens),
+            self._batching_loop(),
+        )
+        return await asyncio.wrap_future(handle)
+
+    async def _enqueue(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: Optional[int],
+    ) -> str:
+        # Runs on the batching loop only, so the queue and drainer flags
+        # are single-threaded state.
+        loop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if not self._draining:
+            self._draining = True
+            loop.create_task(self._drain())
+        future = loop.create_future()
+        self._queue.put_nowait((prompt, temperature, max_tokens, future))
+        return await future
+
+    async def _drain(self) -> None:
+        queue = self._queue
+        while True:
+            try:
+                first = await asyncio.wait_for(
+                    queue.get(), timeout=self._IDLE_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                # Idle: let the task end; _enqueue restarts it on the
+                # next call.
+                self._draining = False
+                return
+            batch = [first]
+            # Let the window elapse so concurrent callers can pile on.
+            await asyncio.sleep(self._WINDOW)
+            while len(batch) < self._MAX_BATCH:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            await self._run_batch(batch)
+
+    async def _run_single(self, prompt, temperature, max_tokens, future):
+        try:
+            result = await self._service.generate_text(
+                prompt, temperature=temperature, max_tokens=max_tokens
+            )
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    async def _run_batch(self, batch) -> None:
+        # Pack only calls that share generation parameters; a combined
+        # request can carry one temperature/max_tokens, so mixing them
+        # would silently run every caller at the defaults.
+        groups: Dict[tuple, list] = {}
+        for entry in batch:
+            groups.setdefault((entry[1], entry[2]), []).append(entry)
+        for group in groups.values():
+            await self._run_group(group)
+
+    async def _run_group(self, group) -> None:
+        if len(group) == 1:
+            await self._run_single(*group[0])
+            return
+        temperature, max_tokens = group[0][1], group[0][2]
+        items = "\n\n".join(
+            f"### Request {index + 1}\n{prompt}"
+            for index, (prompt, _, _, _) in enumerate(group)
+        )
+        packed = (
+            "Answer each numbered request below independently. Respond "
+            "with a JSON array of the answer strings, in the same order, "
+            f"and nothing else.\n\n{items}\n\nJSON array:"
+        )
+        answers = None
+        try:
+            response = await self._service.generate_text(
+                packed, temperature=temperature, max_tokens=max_tokens
+            )
+            parsed = json.loads(response.strip()) if response else None
+            if isinstance(parsed, list) and len(parsed) == len(group):
+                answers = parsed
+        except Exception:
+            answers = None
+        if answers is None:
+            for entry in group:
+                await self._run_single(*entry)
+            return
+        for (_, _, _, future), answer in zip(group, answers):
+            if not future.done():
+                future.set_result(answer if isinstance(answer, str) else "")
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_llm() -> LLMService:
+    """Process-wide LLMService instance.
+
+    Agents that each built their own service also each configured the SDK
+    and (eventually) their own connection pool; sharing one keeps the pool
+    warm across agents. Thread-safe via the import-lock semantics of the
+    first call.
+    """
+    return LLMService()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_batcher() -> BatchingLLMService:
+    """Process-wide batching wrapper over the shared service."""
+    return BatchingLLMService()
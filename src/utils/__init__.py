@@ -0,0 +1 @@
+"""Utility helpers for ViraLearn ContentBot."""
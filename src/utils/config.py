@@ -0,0 +1,36 @@
+"""Unified configuration view over the application settings."""
+
+import functools
+from typing import Any, Dict
+
+from config.settings import get_settings
+
+
+@functools.lru_cache(maxsize=1)
+def get_unified_config() -> Dict[str, Any]:
+    """Return a flat configuration dict used by the system manager and CLI.
+
+    Cached for the process lifetime; invalidate with
+    ``get_unified_config.cache_clear()`` after ``reload_settings()``.
+    """
+    settings = get_settings()
+    return {
+        "app_name": settings.app_name,
+        "environment": settings.environment,
+        "debug": settings.debug,
+        "api_host": settings.api.host,
+        "api_port": settings.api.port,
+        "gemini_model": settings.gemini.model,
+        "gemini_api_key": settings.gemini.api_key,
+        "supported_platforms": list(settings.content.supported_platforms),
+        "log_level": settings.monitoring.log_level,
+    }
+
+
+def validate_all_config() -> bool:
+    """Validate that settings load and contain sane values."""
+    try:
+        config = get_unified_config()
+    except Exception:
+        return False
+    return bool(config["app_name"]) and 0 < config["api_port"] < 65536
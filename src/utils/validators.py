@@ -0,0 +1,41 @@
+"""Validation helpers for workflow state and user input."""
+
+from src.core.error_handling import ValidationException
+from src.models.state_models import ContentState
+
+
+def validate_content_state(state: ContentState) -> None:
+    """Check a workflow state for structural problems before an agent runs.
+
+    Raises :class:`ValidationException` on the first violation found.
+    """
+    if not state.workflow_id:
+        raise ValidationException("workflow_id must not be empty")
+    if not state.user_id:
+        raise ValidationException("user_id must not be empty")
+    if state.step_count < 0:
+        raise ValidationException("step_count must be non-negative")
+    for key, value in state.text_content.items():
+        if not isinstance(value, str):
+            raise ValidationException(
+                f"text_content[{key!r}] must be a string, got {type(value).__name__}"
+            )
+    for key, scores in state.quality_scores.items():
+        if not isinstance(scores, (int, float)):
+            raise ValidationException(
+                f"quality_scores[{key!r}] must be numeric, got {type(scores).__name__}"
+            )
+
+
+def validate_content_state_cached(state: ContentState) -> None:
+    """Validate a state, skipping work if this revision already passed.
+
+    With several agents per workflow the same unchanged state would
+    otherwise be re-walked on every step; the last-validated revision is
+    stored on the state itself, so the repeat calls are two attribute
+    reads and the marker cannot outlive (or be mistaken for) its state.
+    """
+    if state._validated_revision == state._revision:
+        return
+    validate_content_state(state)
+    state._validated_revision = state._revision
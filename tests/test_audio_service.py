@@ -0,0 +1,46 @@
+"""Tests for AudioService batch-audio splitting."""
+
+from types import SimpleNamespace
+
+import pytest
+
+audio_service = pytest.importorskip("src.services.audio_service")
+
+
+def _response(audio, seconds):
+    return SimpleNamespace(
+        audio_content=audio,
+        timepoints=[SimpleNamespace(time_seconds=s) for s in seconds],
+    )
+
+
+def _requests(count):
+    return [audio_service.TTSRequest(text=f"item {i}") for i in range(count)]
+
+
+def test_split_batch_audio_proportional():
+    # Three items plus the trailing sentinel at the total duration.
+    response = _response(b"0123456789AB", [0.0, 2.0, 4.0, 6.0])
+    payloads = audio_service.AudioService._split_batch_audio(
+        response, _requests(3)
+    )
+    assert [p["audio_data"] for p in payloads] == [b"0123", b"4567", b"89AB"]
+
+
+def test_split_batch_audio_last_item_not_empty():
+    # Uneven boundaries: the final slice must still carry its own bytes.
+    response = _response(b"0123456789", [0.0, 1.0, 9.0, 10.0])
+    payloads = audio_service.AudioService._split_batch_audio(
+        response, _requests(3)
+    )
+    assert payloads[-1]["audio_data"] == b"9"
+    assert all(p["audio_data"] for p in payloads)
+
+
+def test_split_batch_audio_missing_marks_falls_back():
+    # Without the full set of marks everyone receives the whole payload.
+    response = _response(b"0123456789", [0.0])
+    payloads = audio_service.AudioService._split_batch_audio(
+        response, _requests(3)
+    )
+    assert [p["audio_data"] for p in payloads] == [b"0123456789"] * 3
@@ -0,0 +1,46 @@
+"""Parity between the Aho–Corasick keyword scan and the regex fallback."""
+
+import pytest
+
+ahocorasick = pytest.importorskip("ahocorasick")
+brand_voice = pytest.importorskip("src.agents.brand_voice")
+
+KEYWORDS = {
+    "positive": ["help", "amazing", "great"],
+    "negative": ["hate", "awful"],
+    "passive": ["was done", "is being"],
+    "formal": ["therefore", "regarding"],
+    "informal": ["cool", "gonna"],
+}
+
+# Substring traps: "school" contains "cool", "chateau" contains "hate",
+# "helpless" contains "help", "greetings" contains "great".
+TRICKY_TEXTS = [
+    "school is cool and your help was amazing",
+    "the chateau was awful; i hate helpless greetings",
+    "therefore the report was done regarding nothing",
+    "gonna regard the schooling therefore, so cool",
+]
+
+
+def _agent_with_automaton():
+    # Bypass __init__: _scan_counts only needs the automaton, built here
+    # exactly as _load_brand_guidelines builds it.
+    agent = object.__new__(brand_voice.BrandVoice)
+    ac = ahocorasick.Automaton()
+    for polarity, name in enumerate(brand_voice._POLARITIES):
+        for word in KEYWORDS[name]:
+            key = word.lower()
+            ac.add_word(key, (polarity, len(key)))
+    ac.make_automaton()
+    agent._ac = ac
+    return agent
+
+
+@pytest.mark.parametrize("text", TRICKY_TEXTS)
+def test_scan_counts_matches_regex_fallback(text):
+    agent = _agent_with_automaton()
+    counts = agent._scan_counts(text.lower())
+    for name in brand_voice._POLARITIES:
+        pattern = brand_voice._compile_keywords(KEYWORDS[name])
+        assert counts[name] == len(pattern.findall(text.lower())), name